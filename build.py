@@ -13,33 +13,55 @@ Usage:
 
 import re
 import sys
+import shutil
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 SCRIPT_FILE = Path(__file__).parent / "sims4_mod_manager.py"
+# Resolved once so each git call skips the PATH search
+GIT = shutil.which('git') or 'git'
 VERSION_PATTERN = re.compile(r'^__version__ = ["\']([^"\']+)["\']', re.MULTILINE)
+SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+$')
+# Number of space-separated fields before the path in each `git status --porcelain=v2` record type
+PORCELAIN_V2_FIELDS = {'1 ': 8, '2 ': 9, 'u ': 10}
 
 
-def get_version() -> str:
-    """Get current version from script."""
-    content = SCRIPT_FILE.read_text(encoding='utf-8')
+def read_script() -> str:
+    """Read the script source."""
+    return SCRIPT_FILE.read_text(encoding='utf-8')
+
+
+def version_from_content(content: str) -> str:
+    """Get version from script source."""
     match = VERSION_PATTERN.search(content)
     if match:
         return match.group(1)
     raise ValueError("Could not find __version__ in script")
 
 
-def set_version(new_version: str) -> None:
-    """Set version in script."""
-    content = SCRIPT_FILE.read_text(encoding='utf-8')
-    new_content = VERSION_PATTERN.sub(f'__version__ = "{new_version}"', content)
-    SCRIPT_FILE.write_text(new_content, encoding='utf-8')
+def get_version() -> str:
+    """Get current version from script."""
+    return version_from_content(read_script())
+
+
+def rewrite_version(content: str, new_version: str) -> str:
+    """Return script source with __version__ replaced."""
+    return VERSION_PATTERN.sub(f'__version__ = "{new_version}"', content)
+
+
+def set_version(new_version: str, content: Optional[str] = None) -> None:
+    """Set version in script, reusing already-read source if given."""
+    if content is None:
+        content = read_script()
+    SCRIPT_FILE.write_text(rewrite_version(content, new_version), encoding='utf-8')
     print(f"Updated version to {new_version}")
 
 
-def bump_version(bump_type: str) -> str:
+def bump_version(bump_type: str, current: Optional[str] = None) -> str:
     """Bump version and return new version string."""
-    current = get_version()
+    if current is None:
+        current = get_version()
     parts = [int(x) for x in current.split('.')]
 
     # Pad to 3 parts if needed
@@ -52,7 +74,7 @@ def bump_version(bump_type: str) -> str:
         parts = [parts[0], parts[1] + 1, 0]
     elif bump_type == 'patch':
         parts = [parts[0], parts[1], parts[2] + 1]
-    elif re.match(r'^\d+\.\d+\.\d+$', bump_type):
+    elif SEMVER_RE.match(bump_type):
         # Specific version provided
         return bump_type
     else:
@@ -62,9 +84,33 @@ def bump_version(bump_type: str) -> str:
 
 
 def run(cmd: list, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a command and print it."""
+    """Run a command and print it.
+
+    The child gets no stdin; none of the build steps read from it.
+    """
     print(f"$ {' '.join(cmd)}")
-    return subprocess.run(cmd, check=check)
+    return subprocess.run(cmd, check=check, stdin=subprocess.DEVNULL)
+
+
+def git_status() -> dict:
+    """Get branch, upstream and uncommitted changes from a single `git status` call."""
+    result = subprocess.run(
+        [GIT, 'status', '--branch', '--porcelain=v2'],
+        capture_output=True, text=True, stdin=subprocess.DEVNULL
+    )
+    status = {'branch': None, 'upstream': None, 'changes': []}
+    for line in result.stdout.splitlines():
+        if line.startswith('# branch.head '):
+            status['branch'] = line.split(' ', 2)[2]
+        elif line.startswith('# branch.upstream '):
+            status['upstream'] = line.split(' ', 2)[2]
+        elif line.startswith('? '):
+            status['changes'].append(f"?? {line[2:]}")
+        elif line[:2] in PORCELAIN_V2_FIELDS:
+            # Ordinary/renamed/unmerged records: "<type> <XY> ... <path>"
+            fields = line.split(' ', PORCELAIN_V2_FIELDS[line[:2]])
+            status['changes'].append(f"{fields[1]} {fields[-1].replace(chr(9), ' <- ')}")
+    return status
 
 
 def cmd_build():
@@ -87,15 +133,16 @@ def cmd_build():
 
 def cmd_bump(bump_type: str = 'patch'):
     """Bump version number."""
-    current = get_version()
-    new_version = bump_version(bump_type)
+    content = read_script()
+    current = version_from_content(content)
+    new_version = bump_version(bump_type, current)
 
     print(f"Current version: {current}")
     print(f"New version: {new_version}")
 
     confirm = input("Apply this version? (y/n): ").strip().lower()
     if confirm == 'y':
-        set_version(new_version)
+        set_version(new_version, content)
     else:
         print("Cancelled")
 
@@ -103,18 +150,19 @@ def cmd_bump(bump_type: str = 'patch'):
 def cmd_release(bump_type: str = 'patch'):
     """Create a release: bump version, commit, tag, and push."""
     # Check for uncommitted changes (excluding version bump we're about to make)
-    result = subprocess.run(['git', 'status', '--porcelain'], capture_output=True, text=True)
-    if result.stdout.strip():
+    status = git_status()
+    if status['changes']:
         print("Warning: You have uncommitted changes:")
-        print(result.stdout)
+        print('\n'.join(status['changes']))
         confirm = input("Continue anyway? (y/n): ").strip().lower()
         if confirm != 'y':
             print("Cancelled")
             return
 
-    # Bump version
-    current = get_version()
-    new_version = bump_version(bump_type)
+    # Bump version (read the script once and write the same content back)
+    content = read_script()
+    current = version_from_content(content)
+    new_version = bump_version(bump_type, current)
 
     print(f"\nRelease plan:")
     print(f"  Current version: {current}")
@@ -124,7 +172,10 @@ def cmd_release(bump_type: str = 'patch'):
     print(f"  1. Update __version__ in sims4_mod_manager.py")
     print(f"  2. Commit the change")
     print(f"  3. Create tag v{new_version}")
-    print(f"  4. Push commit and tag to origin")
+    if status['upstream']:
+        print(f"  4. Push commit and tag to {status['upstream']} (git push --follow-tags)")
+    else:
+        print(f"  4. Push commit and tag to origin, setting it as upstream of {status['branch']}")
     print(f"  5. GitHub Actions will build and create the release")
 
     confirm = input("\nProceed? (y/n): ").strip().lower()
@@ -133,14 +184,16 @@ def cmd_release(bump_type: str = 'patch'):
         return
 
     # Update version
-    set_version(new_version)
-
-    # Git operations
-    run(['git', 'add', 'sims4_mod_manager.py'])
-    run(['git', 'commit', '-m', f'Bump version to {new_version}'])
-    run(['git', 'tag', '-a', f'v{new_version}', '-m', f'Release v{new_version}'])
-    run(['git', 'push'])
-    run(['git', 'push', 'origin', f'v{new_version}'])
+    set_version(new_version, content)
+
+    # Git operations: committing the path directly skips a separate `git add`,
+    # and --follow-tags pushes the annotated tag together with the commit
+    run([GIT, 'commit', '-m', f'Bump version to {new_version}', '--', 'sims4_mod_manager.py'])
+    run([GIT, 'tag', '-a', f'v{new_version}', '-m', f'Release v{new_version}'])
+    if status['upstream']:
+        run([GIT, 'push', '--follow-tags'])
+    else:
+        run([GIT, 'push', '--follow-tags', '-u', 'origin', status['branch']])
 
     print(f"\nRelease v{new_version} initiated!")
     print("GitHub Actions will now build and publish the release.")
@@ -28,6 +28,9 @@ import sys
 # Can be overridden with --debug flag
 DEBUG = not getattr(sys, 'frozen', False)
 
+# The database is written compactly; set S4MM_PRETTY_DB=1 to indent it for inspection
+PRETTY_DB = bool(os.environ.get('S4MM_PRETTY_DB'))
+
 
 def debug_print(*args, **kwargs):
     """Print only when debug mode is enabled."""
@@ -38,34 +41,150 @@ def debug_print(*args, **kwargs):
 import json
 import hashlib
 import fnmatch
+import io
 import zipfile
-import marshal
-import requests
-from collections import Counter
+import mmap
+import importlib.util
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
 from datetime import datetime, timedelta
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional, Any
+from types import CodeType
+from typing import Optional, Any, Callable, Iterable
 import re
 import shutil
-import tempfile
 import subprocess
+import threading
 import webbrowser
 
+# BeautifulSoup is only needed when checking mod pages, so it is imported on
+# first use (see make_soup) instead of slowing down every startup
+BeautifulSoup = None
+SoupStrainer = None
+BS4_AVAILABLE = importlib.util.find_spec('bs4') is not None
+if not BS4_AVAILABLE:
+    print("Note: Install beautifulsoup4 for web scraping features: pip install beautifulsoup4")
+
+# lxml's C parser is much faster than the pure-Python html.parser; optional
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+
+def make_soup(markup: str, only_tags: Optional[tuple[str, ...]] = None) -> "BeautifulSoup":
+    """Parse HTML with BeautifulSoup, importing bs4 the first time it's needed.
+
+    With only_tags, only those elements (and everything inside them) are built.
+    """
+    global BeautifulSoup, SoupStrainer
+    if BeautifulSoup is None:
+        from bs4 import BeautifulSoup, SoupStrainer
+    parse_only = SoupStrainer(list(only_tags)) if only_tags else None
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=parse_only)
+
+# With lxml installed, the version search runs on lxml's own tree (see make_tree),
+# where walking elements and collecting their text happens in C
+lxml_html = None
+
+
+def make_tree(markup: str, only_tags: Optional[tuple[str, ...]] = None) -> Optional["lxml_html.HtmlElement"]:
+    """Parse HTML into an lxml tree, or return None if lxml is missing or can't parse it.
+
+    The text inside script, style and template elements is cleared, so the
+    tree's text matches what BeautifulSoup's get_text() sees. With only_tags,
+    text outside those elements (say, directly in <body> or a top-level <svg>)
+    is cleared too, matching make_soup(markup, only_tags).
+    """
+    global lxml_html
+    if HTML_PARSER != 'lxml':
+        return None
+    if lxml_html is None:
+        import lxml.html as lxml_html
+    try:
+        tree = lxml_html.document_fromstring(markup)
+    except Exception:
+        return None  # e.g. empty pages, or XHTML with an encoding declaration
+    for hidden in tree.iter('script', 'style', 'template'):
+        for elem in hidden.iter():
+            elem.text = None
+            if elem is not hidden:
+                elem.tail = None
+    if only_tags:
+        # Elements whose .text and children's .tail lie outside every only_tags element
+        stack = [(tree, False)]
+        while stack:
+            elem, inside = stack.pop()
+            inside = inside or elem.tag in only_tags
+            if not inside:
+                elem.text = None
+            for child in elem:
+                if not inside:
+                    child.tail = None
+                if isinstance(child.tag, str):
+                    stack.append((child, inside))
+    return tree
+
+# requests pulls in urllib3, ssl and http.client, which is a large share of startup
+# time. It's imported on first use (see make_session), so the startup update check
+# does the import on its background thread while the scan runs.
+requests = None
+
+# Mod sites serve different (or no) pages to unknown clients
+BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+
+def make_session(user_agent: str, pool_size: Optional[int] = None, retries: int = 0) -> "requests.Session":
+    """Create an HTTP session, importing requests the first time it's needed.
+
+    pool_size keeps that many connections alive per host (and up to 32 hosts);
+    retries re-sends requests that hit a connection error or a 502/503/504.
+    """
+    global requests
+    if requests is None:
+        import requests
+    session = requests.Session()
+    if pool_size or retries:
+        from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+        from urllib3.util.retry import Retry
+        pool_size = pool_size or DEFAULT_POOLSIZE
+        adapter = HTTPAdapter(
+            pool_connections=max(pool_size, 32),
+            pool_maxsize=pool_size,
+            # raise_on_status=False hands back the last response so callers still check its status
+            max_retries=Retry(total=retries, backoff_factor=0.3,
+                              status_forcelist=(502, 503, 504), raise_on_status=False),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+    session.headers.update({'User-Agent': user_agent})
+    return session
+
+# Optional fast JSON backend for the mod database
 try:
-    from bs4 import BeautifulSoup
-    BS4_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    BS4_AVAILABLE = False
-    print("Note: Install beautifulsoup4 for web scraping features: pip install beautifulsoup4")
+    ORJSON_AVAILABLE = False
+
+# Optional SIMD/multithreaded hashing for mod identity
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Optional PEP 440 parsing for comparing plain release versions
+try:
+    from packaging.version import Version, InvalidVersion
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
 
 # Rich terminal UI
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TaskProgressColumn
 from rich.prompt import Prompt, Confirm
-from rich.text import Text
-from rich.style import Style
 from rich import box
 
 console = Console()
@@ -75,6 +194,16 @@ console = Console()
 # AUTO UPDATER
 # ============================================================================
 
+@lru_cache(maxsize=64)
+def parse_release_version(version: str) -> tuple[int, ...]:
+    """Parse a dotted release version like "1.2.3" into a tuple of ints.
+
+    Raises ValueError for non-numeric parts. Results are cached, since the
+    running version is parsed on every update check.
+    """
+    return tuple(int(x) for x in version.split('.'))
+
+
 class AutoUpdater:
     """Handles automatic updates from GitHub Releases."""
 
@@ -82,62 +211,146 @@ class AutoUpdater:
     GITHUB_REPO = "swilson-sonicate/sims4_mod_manager"
     GITHUB_API_URL = "https://api.github.com/repos/{repo}/releases/latest"
     UPDATE_CHECK_TIMEOUT = 5  # seconds
+    UPDATE_CHECK_INTERVAL = timedelta(hours=6)  # reuse the cached release within this window
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes per write when downloading a release
 
-    def __init__(self):
+    def __init__(self, db: Optional["ModDatabase"] = None):
+        self.db = db  # Optional; caches the latest release between runs
+        self._check_thread: Optional[threading.Thread] = None
+        self._background_result: tuple[Optional[dict], dict] = (None, {})
         self.is_frozen = getattr(sys, 'frozen', False)
         self.executable_path = Path(sys.executable if self.is_frozen else __file__).resolve()
 
+        # Remove the executable left behind by a previous update
+        if self.is_frozen:
+            try:
+                self.executable_path.with_suffix('.old').unlink(missing_ok=True)
+            except OSError:
+                pass  # Still locked by the exiting process; retried next startup
+
+        self._session: Optional["requests.Session"] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """One session (and connection) reused for the release lookup and the asset download."""
+        if self._session is None:
+            self._session = make_session(f'sims4-mod-manager/{__version__}', pool_size=4)
+        return self._session
+
     def check_for_update(self) -> Optional[dict]:
         """Check GitHub for a newer release.
 
+        The latest release is cached in the database settings. Within
+        UPDATE_CHECK_INTERVAL the cache is used without a request; after that
+        the request is conditional on the cached ETag, so an unchanged release
+        comes back as a 304 that doesn't count against the API rate limit.
+
         Returns release info dict if update available, None otherwise.
         """
+        return self._finish_check(self._fetch_release(self._settings_snapshot()))
+
+    def start_background_check(self):
+        """Start check_for_update on a daemon thread; prompt_and_update collects the result."""
+        settings = self._settings_snapshot()
+
+        def worker():
+            self._background_result = self._fetch_release(settings)
+
+        self._check_thread = threading.Thread(target=worker, daemon=True)
+        self._check_thread.start()
+
+    def _settings_snapshot(self) -> dict:
+        """Copy the database settings so a background check never touches shared state."""
+        return dict(self.db.data.get('settings', {})) if self.db else {}
+
+    def _fetch_release(self, settings: dict) -> tuple[Optional[dict], dict]:
+        """Get the latest release, from cache or GitHub.
+
+        Returns (release_info, settings_updates); release_info is None on failure.
+        Safe to run on a worker thread: it only reads the given settings copy.
+        """
         try:
-            import requests
-            url = self.GITHUB_API_URL.format(repo=self.GITHUB_REPO)
-            response = requests.get(url, timeout=self.UPDATE_CHECK_TIMEOUT)
-            response.raise_for_status()
+            release_info = settings.get('updater_release')
+            if release_info and self._checked_recently(settings.get('updater_last_check')):
+                return release_info, {}
 
-            release = response.json()
-            remote_version = release.get('tag_name', '').lstrip('v')
-
-            if self._is_newer_version(remote_version, __version__):
-                return {
-                    'version': remote_version,
-                    'tag_name': release.get('tag_name'),
-                    'name': release.get('name'),
-                    'body': release.get('body', ''),
-                    'html_url': release.get('html_url'),
-                    'assets': release.get('assets', []),
-                    'published_at': release.get('published_at')
-                }
-            return None
+            headers = {'Accept': 'application/vnd.github+json'}
+            if release_info and settings.get('updater_etag'):
+                headers['If-None-Match'] = settings['updater_etag']
+
+            url = self.GITHUB_API_URL.format(repo=self.GITHUB_REPO)
+            response = self.session.get(url, headers=headers, timeout=self.UPDATE_CHECK_TIMEOUT)
+
+            updates = {'updater_last_check': datetime.now().isoformat()}
+            if response.status_code != 304:
+                response.raise_for_status()
+                release_info = self._release_info(response.json())
+                updates['updater_release'] = release_info
+                updates['updater_etag'] = response.headers.get('ETag')
+            return release_info, updates
         except Exception as e:
             # Silently fail - don't interrupt startup for update check failures
-            return None
+            return None, {}
+
+    def _finish_check(self, result: tuple[Optional[dict], dict]) -> Optional[dict]:
+        """Persist cache updates from _fetch_release and return the release if it's newer."""
+        release_info, updates = result
+        if updates and self.db:
+            self.db.data.setdefault('settings', {}).update(updates)
+            try:
+                self.db.save()
+            except OSError:
+                pass
+        if release_info and self._is_newer_version(release_info.get('version', ''), __version__):
+            return release_info
+        return None
+
+    def _checked_recently(self, last_check: Optional[str]) -> bool:
+        """Check whether the last update check is within UPDATE_CHECK_INTERVAL."""
+        try:
+            return datetime.now() - datetime.fromisoformat(last_check) < self.UPDATE_CHECK_INTERVAL
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _release_info(release: dict) -> dict:
+        """Extract the fields the updater needs from a GitHub release payload."""
+        return {
+            'version': release.get('tag_name', '').lstrip('v'),
+            'tag_name': release.get('tag_name'),
+            'name': release.get('name'),
+            'body': release.get('body', ''),
+            'html_url': release.get('html_url'),
+            'assets': [
+                {
+                    'name': asset.get('name'),
+                    'browser_download_url': asset.get('browser_download_url'),
+                    'digest': asset.get('digest'),
+                }
+                for asset in release.get('assets', [])
+            ],
+            'published_at': release.get('published_at')
+        }
 
     def _is_newer_version(self, remote: str, local: str) -> bool:
         """Compare version strings. Returns True if remote is newer."""
         try:
-            def parse_version(v: str) -> list:
-                return [int(x) for x in v.split('.')]
-
-            remote_parts = parse_version(remote)
-            local_parts = parse_version(local)
+            remote_parts = parse_release_version(remote)
+            local_parts = parse_release_version(local)
 
             # Pad to same length
             max_len = max(len(remote_parts), len(local_parts))
-            remote_parts += [0] * (max_len - len(remote_parts))
-            local_parts += [0] * (max_len - len(local_parts))
+            remote_parts += (0,) * (max_len - len(remote_parts))
+            local_parts += (0,) * (max_len - len(local_parts))
 
             return remote_parts > local_parts
         except (ValueError, AttributeError):
             return False
 
     def download_and_update(self, release_info: dict) -> bool:
-        """Download new version and schedule update.
+        """Download new version, swap it in place of the running executable and launch it.
 
-        Returns True if update was scheduled successfully.
+        Returns True if the update was installed (the caller should exit).
         """
         if not self.is_frozen:
             print("Auto-update is only available for the compiled executable.")
@@ -158,14 +371,15 @@ class AutoUpdater:
             return False
 
         try:
-            import requests
             download_url = exe_asset.get('browser_download_url')
             asset_name = exe_asset.get('name')
 
+            expected_sha256 = self._expected_sha256(release_info, exe_asset)
+
             print(f"\nDownloading {asset_name}...")
 
             # Download to temp file with progress
-            response = requests.get(download_url, stream=True, timeout=60)
+            response = self.session.get(download_url, stream=True, timeout=60)
             response.raise_for_status()
 
             total_size = int(response.headers.get('content-length', 0))
@@ -174,33 +388,52 @@ class AutoUpdater:
             # Create temp file in same directory as executable (to ensure same filesystem)
             temp_path = self.executable_path.parent / f"_update_{asset_name}"
 
+            last_pct = -1.0
+            sha256 = hashlib.sha256()  # Hashed while streaming, so verifying needs no second read
             with open(temp_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    sha256.update(chunk)
                     f.write(chunk)
                     downloaded += len(chunk)
                     if total_size > 0:
                         pct = (downloaded / total_size) * 100
-                        print(f"\rDownloading: {pct:.1f}%", end='', flush=True)
+                        # Only redraw when the shown value changes meaningfully
+                        if pct - last_pct >= 0.5 or downloaded >= total_size:
+                            print(f"\rDownloading: {pct:.1f}%", end='', flush=True)
+                            last_pct = pct
 
             print("\nDownload complete!")
 
-            # Create batch script to replace executable after this process exits
-            batch_path = self.executable_path.parent / "_updater.bat"
-            with open(batch_path, 'w') as f:
-                f.write('@echo off\n')
-                f.write('echo Updating Sims 4 Mod Manager...\n')
-                f.write('timeout /t 2 /nobreak >nul\n')  # Wait for process to exit
-                f.write(f'del "{self.executable_path}"\n')
-                f.write(f'move "{temp_path}" "{self.executable_path}"\n')
-                f.write(f'echo Update complete! Starting new version...\n')
-                f.write(f'start "" "{self.executable_path}"\n')
-                f.write(f'del "%~f0"\n')  # Delete the batch file itself
-
-            print("Update scheduled. The application will restart with the new version.")
-
-            # Launch the batch script and exit
+            if expected_sha256:
+                if sha256.hexdigest() != expected_sha256:
+                    temp_path.unlink()
+                    print("Checksum mismatch - the download may be corrupted. Update cancelled.")
+                    print(f"Please download manually from: {release_info.get('html_url')}")
+                    return False
+                debug_print("Checksum verified.")
+            else:
+                debug_print("No checksum published for this release; skipping verification.")
+
+            # A running executable can't be deleted on Windows, but it can be
+            # renamed, so move it aside and swap the new one into its place
+            old_path = self.executable_path.with_suffix('.old')
+            old_path.unlink(missing_ok=True)
+            os.replace(self.executable_path, old_path)
+            try:
+                os.replace(temp_path, self.executable_path)
+            except OSError:
+                os.replace(old_path, self.executable_path)
+                raise
+
+            print("Update installed. Restarting with the new version...")
+
+            # Let the new PyInstaller bootloader unpack itself instead of
+            # reusing this process's temporary folder
+            env = os.environ.copy()
+            env['PYINSTALLER_RESET_ENVIRONMENT'] = '1'
             subprocess.Popen(
-                ['cmd', '/c', str(batch_path)],
+                [str(self.executable_path)],
+                env=env,
                 creationflags=subprocess.CREATE_NEW_CONSOLE if sys.platform == 'win32' else 0
             )
 
@@ -211,15 +444,45 @@ class AutoUpdater:
             print(f"Please download manually from: {release_info.get('html_url')}")
             return False
 
+    def _expected_sha256(self, release_info: dict, exe_asset: dict) -> Optional[str]:
+        """Get the published SHA-256 of the executable asset, if the release has one.
+
+        Uses the asset's ``digest`` field from the GitHub API, falling back to a
+        sibling ``<asset>.sha256`` file.
+        """
+        digest = exe_asset.get('digest') or ''
+        if digest.startswith('sha256:'):
+            return digest.split(':', 1)[1].lower()
+
+        checksum_name = f"{exe_asset.get('name')}.sha256"
+        for asset in release_info.get('assets', []):
+            if asset.get('name') == checksum_name:
+                try:
+                    response = self.session.get(asset.get('browser_download_url'), timeout=self.UPDATE_CHECK_TIMEOUT)
+                    response.raise_for_status()
+                    return response.text.split()[0].lower()
+                except (requests.RequestException, IndexError):
+                    return None
+        return None
+
     def prompt_and_update(self) -> bool:
         """Check for updates and prompt user to install.
 
+        Uses the result of start_background_check if one was started.
         Returns True if user chose to update (app should exit).
         """
         print(f"Sims 4 Mod Manager v{__version__}")
         print("Checking for updates...", end=' ', flush=True)
 
-        release_info = self.check_for_update()
+        if self._check_thread is not None:
+            # Started earlier by start_background_check; the request is bounded by its own timeout
+            self._check_thread.join(timeout=self.UPDATE_CHECK_TIMEOUT)
+            if self._check_thread.is_alive():
+                print("No response, skipped for this run.")
+                return False
+            release_info = self._finish_check(self._background_result)
+        else:
+            release_info = self.check_for_update()
 
         if release_info is None:
             print("You have the latest version.")
@@ -256,8 +519,9 @@ class AutoUpdater:
 # CONFIGURATION - Edit these paths if needed!
 # ============================================================================
 
+@cache
 def get_default_mods_path() -> Path:
-    """Get the default Sims 4 Mods folder path based on OS."""
+    """Get the default Sims 4 Mods folder path based on OS (cached per process)."""
     home = Path.home()
     
     # Windows
@@ -268,12 +532,17 @@ def get_default_mods_path() -> Path:
         return home / "Documents" / "Electronic Arts" / "The Sims 4" / "Mods"
     # Linux (with Wine/Proton)
     else:
+        proton_mods = Path("pfx") / "drive_c" / "users" / "steamuser" / "Documents" / "Electronic Arts" / "The Sims 4" / "Mods"
+        # Launched through Steam/Proton: the prefix is given directly, no probing needed
+        compat_data = os.environ.get('STEAM_COMPAT_DATA_PATH')
+        if compat_data:
+            return Path(compat_data) / proton_mods
         # Common Wine path
         wine_path = home / ".wine" / "drive_c" / "users" / os.getlogin() / "Documents" / "Electronic Arts" / "The Sims 4" / "Mods"
         if wine_path.exists():
             return wine_path
         # Proton path (Steam)
-        return home / ".local" / "share" / "Steam" / "steamapps" / "compatdata" / "1222670" / "pfx" / "drive_c" / "users" / "steamuser" / "Documents" / "Electronic Arts" / "The Sims 4" / "Mods"
+        return home / ".local" / "share" / "Steam" / "steamapps" / "compatdata" / "1222670" / proton_mods
 
 
 # ============================================================================
@@ -287,18 +556,22 @@ class ModDatabase:
         self.mods_path = mods_path
         self.db_path = mods_path / "_mod_manager_data.json"
         self.data = self._load()
+        self._dirty = False
     
     def _load(self) -> dict:
         """Load the database from disk."""
         if self.db_path.exists():
             try:
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(self.db_path.read_bytes())
                 with open(self.db_path, 'r', encoding='utf-8') as f:
                     return json.load(f)
-            except json.JSONDecodeError:
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
                 print("Warning: Database corrupted, creating new one.")
         
         return {
             "mods": {},
+            "hash_algorithm": ModScanner.HASH_ALGORITHM,
             "last_game_update": None,
             "settings": {
                 "auto_backup": True,
@@ -307,24 +580,50 @@ class ModDatabase:
         }
     
     def save(self):
-        """Save the database to disk."""
-        with open(self.db_path, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, indent=2, default=str)
+        """Save the database to disk.
+
+        Writes to a temporary file first and swaps it in, so an interrupted
+        save never leaves a truncated database behind.
+        """
+        tmp_path = self.db_path.with_suffix('.tmp')
+        if ORJSON_AVAILABLE:
+            option = orjson.OPT_INDENT_2 if PRETTY_DB else 0
+            tmp_path.write_bytes(orjson.dumps(self.data, option=option, default=str))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                if PRETTY_DB:
+                    json.dump(self.data, f, indent=2, default=str)
+                else:
+                    json.dump(self.data, f, separators=(',', ':'), default=str)
+        os.replace(tmp_path, self.db_path)
+        self._dirty = False
+
+    def flush(self):
+        """Save the database if it has unsaved changes."""
+        if self._dirty:
+            self.save()
     
     def get_mod(self, file_hash: str) -> Optional[dict]:
         """Get mod info by file hash."""
         return self.data["mods"].get(file_hash)
     
     def add_mod(self, file_hash: str, mod_info: dict):
-        """Add or update a mod in the database."""
-        self.data["mods"][file_hash] = mod_info
-        self.save()
+        """Add or update a mod in the database (call flush() to persist).
+
+        Re-adding an identical entry doesn't mark the database dirty, so a
+        rescan of an unchanged folder doesn't rewrite the file.
+        """
+        existing = self.data["mods"].get(file_hash)
+        # Callers often edit the stored dict in place, so the same object always counts as changed
+        if existing is mod_info or existing != mod_info:
+            self.data["mods"][file_hash] = mod_info
+            self._dirty = True
     
     def remove_mod(self, file_hash: str):
-        """Remove a mod from the database."""
+        """Remove a mod from the database (call flush() to persist)."""
         if file_hash in self.data["mods"]:
             del self.data["mods"][file_hash]
-            self.save()
+            self._dirty = True
     
     def mark_game_updated(self):
         """Mark that the game was recently updated."""
@@ -336,11 +635,44 @@ class ModDatabase:
 # MOD SCANNER
 # ============================================================================
 
+def combine_patterns(patterns: list[re.Pattern]) -> re.Pattern:
+    """Fuse patterns into one alternation that matches wherever any of them would.
+
+    Alternation returns the leftmost match rather than the first pattern in
+    priority order, so it's only used to rule out all patterns in one pass.
+    """
+    is_bytes = isinstance(patterns[0].pattern, bytes)
+    parts = []
+    for pattern in patterns:
+        source = pattern.pattern.decode('latin-1') if is_bytes else pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            parts.append(f'(?i:{source})')
+        else:
+            parts.append(f'(?:{source})')
+    combined = '|'.join(parts)
+    return re.compile(combined.encode('latin-1') if is_bytes else combined)
+
+
+def keyword_pattern(keywords) -> re.Pattern:
+    """Compile plain substrings into one alternation, so one search finds any of them."""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+
 class ModScanner:
     """Scans the Mods folder and identifies mod files."""
 
     MOD_EXTENSIONS = {'.package', '.ts4script'}
 
+    # Hash used as the database key. Stored in the database so entries keyed
+    # by another algorithm (MD5, or BLAKE2b when blake3 is added/removed) are
+    # migrated on the next scan.
+    HASH_ALGORITHM = 'blake3-128' if BLAKE3_AVAILABLE else 'blake2b-128'
+    HASH_DIGEST_SIZE = 16
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    # Worker threads used to hash and inspect mod files during a scan
+    SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
     # Patterns to find version in filename or content
     VERSION_PATTERNS = [
         # Year-based versioning: "_2025_7_0" or "_2025.7.0" (MCCC style)
@@ -353,6 +685,10 @@ class ModScanner:
         re.compile(r'[_\-\s](\d+\.\d+(?:\.\d+)*)(?:[_\-\s\.]|$)'),
     ]
 
+    # Trailing build number on a script mod's name or folder ("ModName_58", "ModName v58").
+    # Only used for .ts4script files, where it saves opening the archive.
+    TRAILING_NUMBER_RE = re.compile(r'[_\-\s][Vv]?(\d{1,3})$')
+
     # Patterns to find version in Python/text content (binary patterns for searching in files)
     CONTENT_VERSION_PATTERNS = [
         re.compile(rb'__version__\s*=\s*["\']([^"\']+)["\']'),
@@ -383,81 +719,225 @@ class ModScanner:
         re.compile(rb'(?:version|VERSION|Version).{0,10}?(\d+\.\d+(?:\.\d+)?)', re.IGNORECASE),
         re.compile(rb'(?:version|VERSION|Version).{0,10}?["\'](\d+)["\']', re.IGNORECASE),
     ]
+
+    # One-pass "could any pattern match?" checks, so files without a version
+    # aren't scanned once per pattern
+    FILENAME_VERSION_RE = combine_patterns(VERSION_PATTERNS)
+    CONTENT_VERSION_RE = combine_patterns(CONTENT_VERSION_PATTERNS)
+    # The assignment-style patterns debug_mod_version reports for .py files
+    ASSIGNED_VERSION_PATTERNS = CONTENT_VERSION_PATTERNS[:5]
+    ASSIGNED_VERSION_RE = combine_patterns(ASSIGNED_VERSION_PATTERNS)
+    RAW_VERSION_RE = combine_patterns(RAW_VERSION_PATTERNS)
+
+    # Dedicated version files inside a .ts4script, in priority order
+    # (matched against the end of each member's lowercase basename)
+    VERSION_FILE_NAMES = ('version.txt', 'version', '__version__', 'mod_version.txt')
+
+    # Integers common in code (sizes, alignments, colour values) that are unlikely to be versions
+    EXCLUDED_VERSION_NUMBERS = frozenset({16, 32, 64, 128, 100, 200, 255, 256, 512, 24, 48, 96, 192, 384, 768})
+
+    # Shapes of version-like string constants found in compiled code
+    YEAR_VERSION_RE = re.compile(r'^20\d{2}\.\d+\.\d+$')
+    SEMVER_STRING_RE = re.compile(r'^\d+\.\d+\.\d+$')
+    DIGITS_RE = re.compile(r'^\d+$')
+    DOTTED_VERSION_RE = re.compile(r'^\d+\.\d+(\.\d+)?$')
+    # A bare version such as "58", "v1.2.3" or "1.2a"
+    PLAIN_VERSION_RE = re.compile(r'^v?\d+(\.\d+)*[a-zA-Z]?$')
+    # A string constant next to a version variable name (lowercased)
+    NAMED_VERSION_CONST_RE = re.compile(r'^[\dv][\d\.]*[a-zA-Z]?$')
+    # Year-based versions in raw file content, dotted or underscored
+    YEAR_VERSION_BYTES_RE = re.compile(rb'(20\d{2}\.\d+\.\d+)')
+    YEAR_UNDERSCORE_VERSION_BYTES_RE = re.compile(rb'(20\d{2}_\d+_\d+)')
+
+    # bytes.translate table keeping ASCII digits and turning every other byte into a space
+    DIGITS_ONLY_TABLE = bytes(c if 0x30 <= c <= 0x39 else 0x20 for c in range(256))
+
+    # Bytes read from non-.pyc archive members when searching them for a version
+    MEMBER_READ_LIMIT = 64 * 1024
+
+    # What a version pulled out of file content must look like to be accepted
+    VERSION_RESULT_RE = re.compile(r'^[\d\.]+[a-zA-Z]?$|^20\d{2}[\._]\d+[\._]\d+$')
     
     def __init__(self, mods_path: Path):
         self.mods_path = mods_path
+        # Length of "<mods_path><sep>", the prefix every walked entry.path starts with
+        self._root_prefix_len = len(os.path.join(str(mods_path), ''))
     
-    def scan(self) -> list[dict]:
-        """Scan the mods folder and return info about all mods."""
+    def scan(self, known_mods: Optional[dict[str, dict]] = None, force: bool = False) -> list[dict]:
+        """Scan the mods folder and return info about all mods.
+
+        known_mods maps relative path -> mod info from a previous scan. Files whose
+        size and mtime haven't changed reuse the stored hash and version instead of
+        being re-read. Pass force=True to re-read every file.
+        """
         mods = []
+        known_mods = {} if force else (known_mods or {})
         
         if not self.mods_path.exists():
             print(f"Error: Mods folder not found at {self.mods_path}")
             return mods
         
-        for file_path in self.mods_path.rglob('*'):
-            if file_path.suffix.lower() in self.MOD_EXTENSIONS:
-                # Skip the database file
-                if file_path.name.startswith('_mod_manager'):
-                    continue
-                
-                mod_info = self._get_mod_info(file_path)
-                mods.append(mod_info)
-        
+        entries = self._find_mod_entries()
+
+        # Hashing and version extraction are I/O bound, so overlap them across threads.
+        # Results are slotted back by index so the list keeps the walk order.
+        results: list[Optional[dict]] = [None] * len(entries)
+        with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+            futures = {
+                executor.submit(self._get_mod_info, entry, known_mods): i
+                for i, entry in enumerate(entries)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except OSError as e:
+                    # File was removed or locked between the walk and the read
+                    debug_print(f"Skipping {entries[futures[future]].path}: {e}")
+
+        mods.extend(mod for mod in results if mod is not None)
         return mods
-    
-    def _get_mod_info(self, file_path: Path) -> dict:
-        """Extract information about a mod file."""
-        stat = file_path.stat()
-        is_script = file_path.suffix.lower() == '.ts4script'
 
-        # Try to extract version
-        version = self._extract_version(file_path, is_script)
+    def _find_mod_entries(self) -> list[os.DirEntry]:
+        """Collect a DirEntry for each mod file under the Mods folder.
+
+        Walks with an explicit stack of os.scandir calls. Names are filtered by
+        extension before anything is stat'ed, and symlinked folders are not followed.
+        """
+        suffixes = tuple(self.MOD_EXTENSIONS)
+        entries = []
+        stack = [str(self.mods_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(suffixes):
+                            # Skip the database file
+                            if entry.name.startswith('_mod_manager'):
+                                continue
+                            entries.append(entry)
+            except OSError:
+                pass  # Unreadable folder - skip it as rglob did
+        return entries
+    
+    def _get_mod_info(self, entry: os.DirEntry, known_mods: Optional[dict[str, dict]] = None) -> dict:
+        """Extract information about a mod file found by _find_mod_entries."""
+        stat = entry.stat()  # Cached by scandir on Windows
+        stem, extension = os.path.splitext(entry.name)
+        extension = extension.lower()
+        is_script = extension == '.ts4script'
+        # entry.path always starts with the scanned root, so slicing gives the relative path
+        rel_path = entry.path[self._root_prefix_len:]
+        subfolder = os.path.dirname(rel_path) or None
+
+        # Unchanged size and mtime: trust the previous hash and version rather than
+        # re-reading the file (or opening the .ts4script archive again)
+        previous = known_mods.get(rel_path) if known_mods else None
+        if (previous and previous.get('hash') and 'local_version' in previous
+                and previous.get('size_bytes') == stat.st_size
+                and previous.get('mtime_ns') == stat.st_mtime_ns):
+            file_hash = previous['hash']
+            version = previous['local_version']
+        else:
+            file_hash = self._get_file_hash(entry.path)
+            version = self._extract_version(stem, entry.path, is_script, subfolder)
 
         return {
-            "name": file_path.stem,
-            "filename": file_path.name,
-            "path": str(file_path.relative_to(self.mods_path)),
-            "full_path": str(file_path),
-            "extension": file_path.suffix.lower(),
+            "name": stem,
+            "filename": entry.name,
+            "path": rel_path,
+            "full_path": entry.path,
+            "extension": extension,
             "size_bytes": stat.st_size,
             "size_mb": round(stat.st_size / (1024 * 1024), 2),
             "modified_date": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            "hash": self._get_file_hash(file_path),
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": file_hash,
             "is_script": is_script,
-            "subfolder": str(file_path.parent.relative_to(self.mods_path)) if file_path.parent != self.mods_path else None,
+            "subfolder": subfolder,
             "local_version": version
         }
 
-    def _extract_version(self, file_path: Path, is_script: bool) -> Optional[str]:
+    def _extract_version(self, stem: str, file_path: str, is_script: bool,
+                         subfolder: Optional[str] = None) -> Optional[str]:
         """Try to extract version from a mod file."""
         # First try filename
-        version = self._version_from_filename(file_path.stem)
+        version = self._version_from_filename(stem)
         if version:
             return version
 
-        # For script mods, try to look inside the ZIP
         if is_script:
+            # Cheaper hints before opening the ZIP: a trailing build number
+            # ("ModName_58") or a versioned containing folder ("ModName_v58/")
+            version = self._version_from_trailing_number(stem)
+            if not version and subfolder:
+                folder = os.path.basename(subfolder)
+                version = self._version_from_filename(folder) or self._version_from_trailing_number(folder)
+            if version:
+                return version
+
+            # Otherwise look inside the ZIP
             version = self._version_from_ts4script(file_path)
             if version:
                 return version
 
         return None
 
-    def _version_from_filename(self, filename: str) -> Optional[str]:
-        """Extract version number from filename."""
-        for pattern in self.VERSION_PATTERNS:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _version_from_filename(filename: str) -> Optional[str]:
+        """Extract version number from filename (cached, as stems recur across scans)."""
+        if not ModScanner.FILENAME_VERSION_RE.search(filename):
+            return None
+        for pattern in ModScanner.VERSION_PATTERNS:
             match = pattern.search(filename)
             if match:
                 return match.group(1)
         return None
 
+    @staticmethod
+    def _version_from_trailing_number(name: str) -> Optional[str]:
+        """Extract a short build number from the end of a script mod's name or folder."""
+        match = ModScanner.TRAILING_NUMBER_RE.search(name)
+        return match.group(1) if match else None
+
+    def _first_valid_match(self, patterns: list[re.Pattern], combined: re.Pattern,
+                           content: bytes) -> Optional[str]:
+        """Return the first version-like capture from patterns, in priority order."""
+        if not combined.search(content):
+            return None
+        for pattern in patterns:
+            match = pattern.search(content)
+            if match:
+                result = match.group(1).decode('utf-8', errors='ignore')
+                if self.VERSION_RESULT_RE.match(result):
+                    return result
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _pyc_header_sizes(magic: bytes) -> tuple[int, ...]:
+        """Header sizes to try for a .pyc, given its first four bytes.
+
+        The magic number identifies the Python version (PEP 552): 16-byte headers
+        from 3.7, 12 from 3.3, 8 before that. Unrecognised data tries all three.
+        """
+        if len(magic) < 4 or magic[2:] != b'\r\n':
+            return (16, 12, 8)
+        number = int.from_bytes(magic[:2], 'little')
+        if 3390 <= number < 20000:  # Python 2 magic numbers are above 20000
+            return (16,)
+        if 3210 <= number < 3390:
+            return (12,)
+        return (8,)
+
     def _version_from_pyc(self, pyc_data: bytes) -> Optional[str]:
         """Extract version from compiled Python (.pyc) file by reading constants."""
+        import marshal
         try:
-            # .pyc files have a header (size varies by Python version)
-            # Try different header sizes (16 bytes for Python 3.7+, 12 for 3.6, 8 for older)
-            for header_size in [16, 12, 8]:
+            # .pyc files have a header whose size depends on the Python version
+            for header_size in self._pyc_header_sizes(pyc_data[:4]):
                 if len(pyc_data) <= header_size:
                     continue
                 try:
@@ -477,8 +957,9 @@ class ModScanner:
         Used specifically for files with 'version' in their name where we're more
         confident that integer constants represent version numbers.
         """
+        import marshal
         try:
-            for header_size in [16, 12, 8]:
+            for header_size in self._pyc_header_sizes(pyc_data[:4]):
                 if len(pyc_data) <= header_size:
                     continue
                 try:
@@ -492,11 +973,50 @@ class ModScanner:
             pass
         return None
 
-    def _find_version_in_code_aggressive(self, code: Any, depth: int = 0) -> Optional[str]:
+    @staticmethod
+    def _numeric_version_rank(value: Any) -> tuple[int, int]:
+        """Sort key for version candidates: highest 2-digit number first, then 3-digit.
+
+        Most mods don't reach v100+. Values that aren't integers sort last.
+        """
+        try:
+            num = int(value)
+        except ValueError:
+            return (3, 0)
+        if 10 <= num <= 99:
+            return (0, -num)
+        elif 100 <= num <= 999:
+            return (1, -num)
+        return (2, -num)
+
+    @staticmethod
+    def _digit_candidate_rank(item: tuple[int, int]) -> tuple[int, int, int]:
+        """Sort key for (number, count) pairs: 2-digit first, then most frequent, then highest."""
+        num, count = item
+        return (0 if 10 <= num <= 99 else 1, -count, -num)
+
+    @staticmethod
+    def _version_file_priority(name_lower: str) -> int:
+        """Rank a lowercase member name so "registry" files are tried before "control" files.
+
+        version_registry.pyc is more likely to have the actual version than version_control.pyc.
+        """
+        if 'registry' in name_lower:
+            return 0
+        elif 'info' in name_lower or 'config' in name_lower:
+            return 1
+        elif 'control' in name_lower or 'check' in name_lower:
+            return 3
+        return 2
+
+    def _find_version_in_code_aggressive(self, code: Any, depth: int = 0,
+                                         years_only: bool = False) -> Optional[str]:
         """Search code object for version, including integer constants.
 
         More aggressive than _find_version_in_code - used for files specifically
         named with 'version' where integers are more likely to be version numbers.
+        With years_only, only a year-based version is looked for (one already beat
+        everything else further up).
         """
         if depth > 3:
             return None
@@ -509,34 +1029,36 @@ class ModScanner:
                 year_based_candidates = []  # Like "2025.7.0"
 
                 for const in code.co_consts:
-                    if isinstance(const, str):
+                    # One type lookup per constant instead of chained isinstance/hasattr probes
+                    kind = type(const)
+                    if kind is str:
                         # Year-based version like "2025.7.0" - highest priority
-                        if re.match(r'^20\d{2}\.\d+\.\d+$', const):
+                        if self.YEAR_VERSION_RE.match(const):
                             year_based_candidates.append(const)
+                        # A year-based version always wins, so skip lower-priority checks
+                        elif years_only or year_based_candidates:
+                            continue
                         # Simple digit string like "58"
-                        elif re.match(r'^\d+$', const) and 2 <= len(const) <= 3:
+                        elif 2 <= len(const) <= 3 and self.DIGITS_RE.match(const):
                             num = int(const)
-                            # Exclude common non-version numbers
-                            excluded = {16, 32, 64, 128, 100, 200, 255, 256, 512, 24, 48, 96, 192, 384, 768}
-                            if 10 <= num <= 999 and num not in excluded:
+                            if 10 <= num <= 999 and num not in self.EXCLUDED_VERSION_NUMBERS:
                                 string_candidates.append(const)
                         # Semantic version like "1.2.3"
-                        elif re.match(r'^\d+\.\d+\.\d+$', const):
+                        elif self.SEMVER_STRING_RE.match(const):
                             string_candidates.append(const)
 
                     # Collect integer candidates
-                    elif isinstance(const, int) and 10 <= const <= 999:
-                        # Exclude common non-version numbers (powers of 2, alignment values, etc.)
-                        excluded = {16, 32, 64, 128, 100, 200, 255, 256, 512, 24, 48, 96, 192, 384, 768}
-                        if const not in excluded:
+                    elif kind is int and 10 <= const <= 999:
+                        if not (years_only or year_based_candidates) and const not in self.EXCLUDED_VERSION_NUMBERS:
                             int_candidates.append(const)
 
                     # Recurse into nested code objects
-                    elif hasattr(const, 'co_consts'):
-                        result = self._find_version_in_code_aggressive(const, depth + 1)
+                    elif kind is CodeType:
+                        result = self._find_version_in_code_aggressive(
+                            const, depth + 1, years_only or bool(year_based_candidates))
                         if result:
                             # Check if it's year-based
-                            if re.match(r'^20\d{2}\.\d+\.\d+$', result):
+                            if self.YEAR_VERSION_RE.match(result):
                                 year_based_candidates.append(result)
                             else:
                                 string_candidates.append(result)
@@ -545,6 +1067,8 @@ class ModScanner:
                 if year_based_candidates:
                     year_based_candidates.sort(reverse=True)
                     return year_based_candidates[0]
+                if years_only:
+                    return None
 
                 # Priority 2: Check for version variable names and associated values
                 if hasattr(code, 'co_names'):
@@ -569,33 +1093,11 @@ class ModScanner:
                 # Priority 3: String versions that look like numbers
                 # Prefer 2-digit numbers (10-99) over 3-digit, as most mods don't reach v100+
                 if string_candidates:
-                    def sort_key(s):
-                        try:
-                            num = int(s)
-                            # 2-digit numbers are most likely version numbers
-                            if 10 <= num <= 99:
-                                return (0, -num)  # Highest 2-digit first
-                            elif 100 <= num <= 999:
-                                return (1, -num)  # Then 3-digit
-                            else:
-                                return (2, -num)
-                        except ValueError:
-                            return (3, 0)
-                    string_candidates.sort(key=sort_key)
-                    return string_candidates[0]
+                    return min(string_candidates, key=self._numeric_version_rank)
 
                 # Priority 4: Integer candidates (prefer 2-digit over 3-digit)
                 if int_candidates:
-                    def version_score(n: int) -> tuple:
-                        if 10 <= n <= 99:
-                            return (0, -n)  # Most likely, higher is better
-                        elif 100 <= n <= 999:
-                            return (1, -n)
-                        else:
-                            return (2, -n)
-
-                    int_candidates.sort(key=version_score)
-                    return str(int_candidates[0])
+                    return str(min(int_candidates, key=self._numeric_version_rank))
 
         except Exception:
             pass
@@ -604,9 +1106,10 @@ class ModScanner:
 
     def _debug_pyc_extraction(self, pyc_data: bytes):
         """Debug helper to show what version candidates are found in a .pyc file."""
+        import marshal
         print(f"      --- Debug .pyc extraction ---")
         try:
-            for header_size in [16, 12, 8]:
+            for header_size in self._pyc_header_sizes(pyc_data[:4]):
                 if len(pyc_data) <= header_size:
                     continue
                 try:
@@ -630,18 +1133,16 @@ class ModScanner:
             string_nums = []
             int_nums = []
 
-            excluded = {16, 32, 64, 128, 100, 200, 255, 256, 512, 24, 48, 96, 192, 384, 768}
-
             for const in code.co_consts:
                 if isinstance(const, str):
-                    if re.match(r'^20\d{2}\.\d+\.\d+$', const):
+                    if self.YEAR_VERSION_RE.match(const):
                         year_based.append(const)
-                    elif re.match(r'^\d+$', const) and 2 <= len(const) <= 3:
+                    elif 2 <= len(const) <= 3 and self.DIGITS_RE.match(const):
                         num = int(const)
-                        if 10 <= num <= 999 and num not in excluded:
+                        if 10 <= num <= 999 and num not in self.EXCLUDED_VERSION_NUMBERS:
                             string_nums.append(const)
                 elif isinstance(const, int) and 10 <= const <= 999:
-                    if const not in excluded:
+                    if const not in self.EXCLUDED_VERSION_NUMBERS:
                         int_nums.append(const)
                 elif hasattr(const, 'co_consts'):
                     self._debug_code_constants(const, depth + 1)
@@ -668,27 +1169,28 @@ class ModScanner:
             # Check if it's a code object with constants
             if hasattr(code, 'co_consts'):
                 for const in code.co_consts:
+                    kind = type(const)
                     # Check string constants that look like versions
-                    if isinstance(const, str):
+                    if kind is str:
                         # Simple version number like "58" or "2025.7.0"
-                        if re.match(r'^\d+$', const) and 1 <= len(const) <= 4:
+                        if 1 <= len(const) <= 4 and self.DIGITS_RE.match(const):
                             return const
-                        if re.match(r'^\d+\.\d+(\.\d+)?$', const):
+                        if self.DOTTED_VERSION_RE.match(const):
                             return const
-                        if re.match(r'^20\d{2}\.\d+\.\d+$', const):
+                        if self.YEAR_VERSION_RE.match(const):
                             return const
-                        if re.match(r'^v?\d+(\.\d+)*[a-zA-Z]?$', const.lower()) and len(const) < 20:
+                        if self.PLAIN_VERSION_RE.match(const.lower()) and len(const) < 20:
                             return const
 
                     # Check integer constants (some mods store version as int)
-                    elif isinstance(const, int) and 1 <= const <= 9999:
+                    elif kind is int and 1 <= const <= 9999:
                         # Could be a simple version number, but be careful
                         # Only return if it's in a reasonable range for version numbers
                         # This is a heuristic - version numbers like 58 are common
                         pass  # Skip for now, too many false positives
 
                     # Recurse into nested code objects
-                    elif hasattr(const, 'co_consts'):
+                    elif kind is CodeType:
                         result = self._find_version_in_code(const, depth + 1)
                         if result:
                             return result
@@ -702,7 +1204,7 @@ class ModScanner:
                         if name_lower in ['version', '__version__', 'mod_version', 'current_version']:
                             # Found a version variable, look for nearby string constants
                             for const in consts:
-                                if isinstance(const, str) and re.match(r'^[\dv][\d\.]*[a-zA-Z]?$', const.lower()):
+                                if isinstance(const, str) and self.NAMED_VERSION_CONST_RE.match(const.lower()):
                                     return const
                                 if isinstance(const, int) and 1 <= const <= 999:
                                     return str(const)
@@ -711,73 +1213,82 @@ class ModScanner:
 
         return None
 
-    def _version_from_ts4script(self, file_path: Path) -> Optional[str]:
+    @classmethod
+    def _read_member_head(cls, zf: zipfile.ZipFile, name: str, limit: Optional[int] = None) -> bytes:
+        """Read the start of an archive member, decompressing no further than needed."""
+        with zf.open(name) as member:
+            return member.read(limit or cls.MEMBER_READ_LIMIT)
+
+    def _version_from_ts4script(self, file_path: str) -> Optional[str]:
         """Extract version from a .ts4script file (which is a ZIP archive)."""
         try:
             with zipfile.ZipFile(file_path, 'r') as zf:
                 file_list = zf.namelist()
 
+                # Sort members into the groups searched below in one pass over the archive
+                version_file_hits = []  # (VERSION_FILE_NAMES rank, archive order, name)
+                version_named_hits = []  # (_version_file_priority, archive order, name)
+                json_files, xml_files = [], []
+                for index, name in enumerate(file_list):
+                    name_lower = name.lower()
+                    basename = name_lower.rsplit('/', 1)[-1]
+                    if basename.endswith(self.VERSION_FILE_NAMES):
+                        rank = next(i for i, vf in enumerate(self.VERSION_FILE_NAMES) if basename.endswith(vf))
+                        version_file_hits.append((rank, index, name))
+                    if name.endswith('.json'):
+                        json_files.append(name)
+                    elif name.endswith('.xml'):
+                        xml_files.append(name)
+                    if 'version' in name_lower:
+                        version_named_hits.append((self._version_file_priority(name_lower), index, name))
+
                 # Look for dedicated version files first
-                version_files = ['version.txt', 'VERSION', 'version', '__version__', 'mod_version.txt']
-                for vf in version_files:
-                    for name in file_list:
-                        basename = name.split('/')[-1].lower()
-                        if basename == vf.lower() or basename.endswith(vf.lower()):
-                            try:
-                                content = zf.read(name).decode('utf-8', errors='ignore').strip()
-                                version = content.split('\n')[0].strip()
-                                if version and len(version) < 50:
-                                    return version
-                            except Exception:
-                                pass
+                for _, _, name in sorted(version_file_hits):
+                    try:
+                        content = self._read_member_head(zf, name).decode('utf-8', errors='ignore').strip()
+                        version = content.split('\n')[0].strip()
+                        if version and len(version) < 50:
+                            return version
+                    except Exception:
+                        pass
 
                 # Look for version in JSON files (mod info/manifest)
-                for name in file_list:
-                    if name.endswith('.json'):
-                        try:
-                            content = zf.read(name).decode('utf-8', errors='ignore')
-                            data = json.loads(content)
-                            if isinstance(data, dict):
-                                for key in ['version', 'Version', 'VERSION', 'mod_version', 'modversion', 'ver']:
-                                    if key in data:
-                                        return str(data[key])
-                        except Exception:
-                            pass
+                for name in json_files:
+                    try:
+                        content = zf.read(name).decode('utf-8', errors='ignore')
+                        data = json.loads(content)
+                        if isinstance(data, dict):
+                            for key in ['version', 'Version', 'VERSION', 'mod_version', 'modversion', 'ver']:
+                                if key in data:
+                                    return str(data[key])
+                    except Exception:
+                        pass
 
                 # Look for version in XML files
-                for name in file_list:
-                    if name.endswith('.xml'):
-                        try:
-                            content = zf.read(name).decode('utf-8', errors='ignore')
-                            # Simple regex search for version in XML
-                            for pattern in self.CONTENT_VERSION_PATTERNS:
-                                match = pattern.search(content.encode())
-                                if match:
-                                    return match.group(1).decode('utf-8', errors='ignore')
-                        except Exception:
-                            pass
+                for name in xml_files:
+                    try:
+                        content = zf.read(name).decode('utf-8', errors='ignore').encode()
+                        if not self.CONTENT_VERSION_RE.search(content):
+                            continue
+                        # Simple regex search for version in XML
+                        for pattern in self.CONTENT_VERSION_PATTERNS:
+                            match = pattern.search(content)
+                            if match:
+                                return match.group(1).decode('utf-8', errors='ignore')
+                    except Exception:
+                        pass
 
                 # PRIORITY: Search for version in files with "version" in the name FIRST
                 # These are most likely to contain the actual mod version
-                version_named_files = [n for n in file_list if 'version' in n.lower()]
-
-                # Sort to prioritize "registry" files over "control" files
-                # (version_registry.pyc is more likely to have the actual version than version_control.pyc)
-                def version_file_priority(name: str) -> int:
-                    name_lower = name.lower()
-                    if 'registry' in name_lower:
-                        return 0
-                    elif 'info' in name_lower or 'config' in name_lower:
-                        return 1
-                    elif 'control' in name_lower or 'check' in name_lower:
-                        return 3
-                    else:
-                        return 2
-                version_named_files.sort(key=version_file_priority)
+                version_named_files = [name for _, _, name in sorted(version_named_hits)]
 
                 for name in version_named_files:
                     try:
-                        content = zf.read(name)
+                        # marshal needs the whole .pyc; other files are only searched near the start
+                        if name.endswith('.pyc'):
+                            content = zf.read(name)
+                        else:
+                            content = self._read_member_head(zf, name)
 
                         # For .pyc files with "version" in name, try aggressive extraction FIRST
                         # This handles mods like WonderfulWhims that store version as integer
@@ -792,88 +1303,103 @@ class ModScanner:
                             # Look for simple version number on its own line
                             for line in text_content.split('\n')[:10]:
                                 line = line.strip()
-                                if re.match(r'^v?\d+(\.\d+)*[a-zA-Z]?$', line) and len(line) < 20:
+                                if self.PLAIN_VERSION_RE.match(line) and len(line) < 20:
                                     return line.lstrip('v')
                             # Try content patterns
-                            for pattern in self.CONTENT_VERSION_PATTERNS:
-                                match = pattern.search(content)
-                                if match:
-                                    result = match.group(1).decode('utf-8', errors='ignore')
-                                    if re.match(r'^[\d\.]+[a-zA-Z]?$|^20\d{2}[\._]\d+[\._]\d+$', result):
-                                        return result
-
-                        # Fallback 1: search for year-based versions (e.g., 2025.7.0) - highest priority
-                        year_matches = re.findall(rb'(20\d{2}\.\d+\.\d+)', content)
-                        if year_matches:
-                            # Return the highest year-based version found
-                            versions = sorted(set(m.decode('utf-8', errors='ignore') for m in year_matches), reverse=True)
-                            if versions:
-                                return versions[0]
-
-                        # Fallback 2: search for year_underscore versions (e.g., 2025_7_0)
-                        year_underscore_matches = re.findall(rb'(20\d{2}_\d+_\d+)', content)
-                        if year_underscore_matches:
-                            versions = sorted(set(m.decode('utf-8', errors='ignore').replace('_', '.') for m in year_underscore_matches), reverse=True)
-                            if versions:
-                                return versions[0]
-
-                        # Fallback 3: search for 2-3 digit numbers in version-named files
-                        digit_matches = re.findall(rb'[^\d](\d{2,3})[^\d]', content)
-                        if digit_matches:
-                            candidates = []
-                            # Exclude common non-version numbers
-                            excluded = {16, 32, 64, 128, 100, 200, 255, 256, 512, 24, 48, 96, 192, 384, 768}
-                            for d in digit_matches:
-                                try:
-                                    num = int(d)
-                                    if 10 <= num <= 999 and num not in excluded:
-                                        candidates.append(num)
-                                except ValueError:
-                                    pass
+                            result = self._first_valid_match(
+                                self.CONTENT_VERSION_PATTERNS, self.CONTENT_VERSION_RE, content)
+                            if result:
+                                return result
+
+                        # Fallbacks 1 and 2 both need a "20xx" year, so a C-level find
+                        # rules them out before running either regex over the file
+                        if b'20' in content:
+                            # Fallback 1: search for year-based versions (e.g., 2025.7.0) - highest priority
+                            year_matches = self.YEAR_VERSION_BYTES_RE.findall(content)
+                            if year_matches:
+                                # Return the highest year-based version found
+                                versions = sorted(set(m.decode('utf-8', errors='ignore') for m in year_matches), reverse=True)
+                                if versions:
+                                    return versions[0]
+
+                            # Fallback 2: search for year_underscore versions (e.g., 2025_7_0)
+                            year_underscore_matches = self.YEAR_UNDERSCORE_VERSION_BYTES_RE.findall(content)
+                            if year_underscore_matches:
+                                versions = sorted(set(m.decode('utf-8', errors='ignore').replace('_', '.') for m in year_underscore_matches), reverse=True)
+                                if versions:
+                                    return versions[0]
+
+                        # Fallback 3: search for 2-3 digit numbers in version-named files.
+                        # Blanking every non-digit byte lets split() pull out the digit runs in C.
+                        digit_runs = content.translate(self.DIGITS_ONLY_TABLE).split()
+                        if digit_runs:
+                            candidates = [
+                                num for num in (int(run) for run in digit_runs if 2 <= len(run) <= 3)
+                                if num >= 10 and num not in self.EXCLUDED_VERSION_NUMBERS
+                            ]
                             if candidates:
                                 counts = Counter(candidates)
-                                # Sort: prefer 2-digit (10-99) over 3-digit, then by count, then by value (higher)
-                                def candidate_sort_key(x):
-                                    is_two_digit = 0 if 10 <= x <= 99 else 1
-                                    return (is_two_digit, -counts[x], -x)
-                                sorted_candidates = sorted(counts.keys(), key=candidate_sort_key)
-                                if sorted_candidates:
-                                    return str(sorted_candidates[0])
+                                best, _ = min(counts.items(), key=self._digit_candidate_rank)
+                                return str(best)
                     except Exception:
                         pass
 
                 # Last resort: search raw content of first few files for version patterns
+                heads = []
                 for name in file_list[:20]:
                     try:
-                        content = zf.read(name)[:4000]  # First 4KB
-                        for pattern in self.RAW_VERSION_PATTERNS:
-                            match = pattern.search(content)
-                            if match:
-                                result = match.group(1).decode('utf-8', errors='ignore')
-                                if re.match(r'^[\d\.]+[a-zA-Z]?$|^20\d{2}[\._]\d+[\._]\d+$', result):
-                                    return result
-                        for pattern in self.CONTENT_VERSION_PATTERNS:
-                            match = pattern.search(content)
-                            if match:
-                                result = match.group(1).decode('utf-8', errors='ignore')
-                                if re.match(r'^[\d\.]+[a-zA-Z]?$|^20\d{2}[\._]\d+[\._]\d+$', result):
-                                    return result
+                        heads.append(self._read_member_head(zf, name, 4000))  # First 4KB
                     except Exception:
                         pass
 
+                # One pass over all the samples rules out the usual no-version case; the
+                # per-member loop keeps the member order and pattern priority
+                blob = b'\x00'.join(heads)
+                if self.RAW_VERSION_RE.search(blob) or self.CONTENT_VERSION_RE.search(blob):
+                    for content in heads:
+                        result = (
+                            self._first_valid_match(self.RAW_VERSION_PATTERNS, self.RAW_VERSION_RE, content)
+                            or self._first_valid_match(
+                                self.CONTENT_VERSION_PATTERNS, self.CONTENT_VERSION_RE, content)
+                        )
+                        if result:
+                            return result
+
         except (zipfile.BadZipFile, Exception):
             pass
 
         return None
     
     @staticmethod
-    def _get_file_hash(file_path: Path) -> str:
-        """Calculate MD5 hash of a file."""
-        hash_md5 = hashlib.md5()
+    def _new_hasher():
+        """Create the fallback hash object used for mod identity (128-bit BLAKE2b)."""
+        return hashlib.blake2b(digest_size=ModScanner.HASH_DIGEST_SIZE)
+
+    @staticmethod
+    def _get_file_hash(file_path: str) -> str:
+        """Calculate the identity hash of a file without reading it into Python objects."""
+        if BLAKE3_AVAILABLE:
+            # Memory-maps the file and hashes large ones across threads (releases the GIL)
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(file_path)
+            return hasher.hexdigest(length=ModScanner.HASH_DIGEST_SIZE)
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            # Large files: hash a read-only mapping in one update() call (with kernel
+            # read-ahead hinted where supported). Empty files can't be mapped.
+            if os.fstat(f.fileno()).st_size >= ModScanner.HASH_CHUNK_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):  # Not available on Windows
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher = ModScanner._new_hasher()
+                    hasher.update(mm)
+                    return hasher.hexdigest()
+            # hashlib.file_digest (Python 3.11+) runs the read loop in C
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, ModScanner._new_hasher).hexdigest()
+            hasher = ModScanner._new_hasher()
+            for chunk in iter(lambda: f.read(ModScanner.HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
 
 
 # ============================================================================
@@ -885,6 +1411,15 @@ class UpdateChecker:
 
     MODTHESIMS_PATTERN = re.compile(r'modthesims\.info/d(?:ownload)?/(\d+)')
 
+    # Tags _find_version, _find_date and _find_download_link look at, plus the usual
+    # text containers for the page-text fallbacks. Generic pages are parsed with only
+    # these, skipping top-level <script>, <style>, <svg>, <link> and the like
+    GENERIC_PAGE_TAGS = (
+        'title', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'meta', 'time', 'a', 'button', 'span', 'div',
+        'p', 'td', 'th', 'li', 'section', 'article', 'main', 'header', 'footer', 'dd', 'dt',
+        'strong', 'b', 'em', 'pre', 'code', 'blockquote',
+    )
+
     # Common version patterns (ordered by specificity - more specific first)
     VERSION_PATTERNS = [
         # Year-based versioning: "2025.7.0" (MCCC style) - must have year + 2 more parts
@@ -902,9 +1437,38 @@ class UpdateChecker:
         # Standalone semantic version (3 parts minimum to avoid matching dates)
         re.compile(r'\b(\d+\.\d+\.\d+)\b'),
     ]
+    # All of VERSION_PATTERNS in one scan, to rule out text with no version quickly
+    VERSION_PATTERNS_RE = combine_patterns(VERSION_PATTERNS)
+
+    # "version" in an element's class or id
+    VERSION_ATTR_RE = re.compile(r'version', re.IGNORECASE)
+    # Whole-string and in-text year-based versions ("2025.7.0", MCCC style)
+    YEAR_VERSION_RE = re.compile(r'^20\d{2}\.\d+\.\d+$')
+    YEAR_VERSION_TEXT_RE = re.compile(r'\b(20\d{2}\.\d+\.\d+)\b')
+    # Every place a year-based version could start, word boundary or not
+    YEAR_VERSION_ANYWHERE_RE = re.compile(r'(?=(20\d{2}\.\d+\.\d+))')
+    # "Version: 1.2.3" text on ModTheSims pages
+    MODTHESIMS_VERSION_RE = re.compile(r'Version:?\s*([\d.]+)')
+    # Splitting and reading version parts in compare_versions
+    VERSION_PART_SEPARATORS_RE = re.compile(r'[.\-_]')
+    LEADING_NUMBER_RE = re.compile(r'(\d+)')
 
     # Version keywords to search near
     VERSION_KEYWORDS = ['version', 'current version', 'latest version', 'release', 'build', 'v.', 'v ']
+    VERSION_KEYWORDS_RE = keyword_pattern(VERSION_KEYWORDS)
+
+    # Tags each _find_version strategy looks at
+    VERSION_ELEMENTS = frozenset({'span', 'div', 'p', 'td', 'dd', 'strong', 'h1', 'h2', 'h3', 'h4', 'a', 'b', 'em'})
+    HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5'})
+    KEYWORD_ELEMENTS = VERSION_ELEMENTS | {'li', 'dt'}
+    CHANGELOG_CONTAINERS = frozenset({'section', 'div', 'article'})
+    CHANGELOG_HEADERS = ('h1', 'h2', 'h3', 'h4')
+    CHANGELOG_KEYWORDS = ('changelog', 'release notes', 'what\'s new', 'updates', 'history', 'releases')
+    CHANGELOG_KEYWORDS_RE = keyword_pattern(CHANGELOG_KEYWORDS)
+
+    # Text near an update/release date
+    UPDATE_KEYWORDS = ['updated', 'modified', 'released', 'published', 'last update']
+    UPDATE_KEYWORDS_RE = keyword_pattern(UPDATE_KEYWORDS)
 
     # Common date patterns
     DATE_PATTERNS = [
@@ -918,6 +1482,69 @@ class UpdateChecker:
     # Download button/link indicators (ordered by priority - "download" first)
     DOWNLOAD_KEYWORDS_PRIMARY = ['download', 'direct link']
     DOWNLOAD_KEYWORDS_SECONDARY = ['get it', 'grab', 'install']
+    DOWNLOAD_KEYWORDS_PRIMARY_RE = keyword_pattern(DOWNLOAD_KEYWORDS_PRIMARY)
+    DOWNLOAD_KEYWORDS_SECONDARY_RE = keyword_pattern(DOWNLOAD_KEYWORDS_SECONDARY)
+    # Mod pages fetched at once by check_urls (also the session's connection pool size)
+    CHECK_WORKERS = 8
+    # Version/date results kept for reuse (see _cached_page_result). Each entry's key
+    # holds its page's HTML, so this stays small
+    PAGE_CACHE_SIZE = 64
+    # Most of a page past its first half megabyte is comments and footers; the
+    # version info is near the top, so the rest isn't downloaded or parsed
+    MAX_PAGE_BYTES = 512 * 1024
+    PAGE_CHUNK_SIZE = 64 * 1024
+
+    # Mod hosting sites whose links are worth following for version info
+    KNOWN_MOD_HOSTS = frozenset({
+        'wonderfulwhims.com', 'deaderpool-mccc.com', 'modthesims.info',
+        'patreon.com', 'simfileshare.net', 'mediafire.com',
+        'mega.nz', 'github.com', 'curseforge.com'
+    })
+    # Links to common download file types, optionally followed by a query string or fragment
+    DOWNLOAD_EXTENSION_RE = re.compile(r'\.(zip|rar|7z|package|ts4script)(?:[?#]|\Z)', re.IGNORECASE)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_version(v: str) -> tuple:
+        """Parse version string into comparable parts (cached, as local versions recur)."""
+        # Remove common prefixes
+        v = v.lower().strip()
+        for prefix in ['v', 'version ', 'ver ', 'ver.']:
+            if v.startswith(prefix):
+                v = v[len(prefix):]
+
+        # Split by dots and convert to integers where possible
+        parts = []
+        for part in UpdateChecker.VERSION_PART_SEPARATORS_RE.split(v):
+            # Try to extract number from part
+            num_match = UpdateChecker.LEADING_NUMBER_RE.match(part)
+            if num_match:
+                parts.append(int(num_match.group(1)))
+                # Handle suffix like "1a" -> (1, 'a')
+                suffix = part[len(num_match.group(1)):]
+                if suffix:
+                    parts.append(suffix)
+            elif part:
+                parts.append(part)
+        return tuple(parts)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_release(v: str) -> Optional["Version"]:
+        """PEP 440 Version for a plain release like "1.2.3" or "v2025.7.0", else None.
+
+        Pre-, post- and dev-releases are left to parse_version: a mod's "1.2.3a"
+        is a fix after 1.2.3, where PEP 440 would read it as an alpha before it.
+        """
+        if not PACKAGING_AVAILABLE:
+            return None
+        try:
+            version = Version(v)
+        except InvalidVersion:
+            return None
+        if version.epoch or version.pre or version.post or version.dev or version.local:
+            return None
+        return version
 
     @staticmethod
     def compare_versions(local: Optional[str], remote: Optional[str]) -> Optional[str]:
@@ -925,32 +1552,25 @@ class UpdateChecker:
         if not local or not remote:
             return None
 
-        def parse_version(v: str) -> list:
-            """Parse version string into comparable parts."""
-            # Remove common prefixes
-            v = v.lower().strip()
-            for prefix in ['v', 'version ', 'ver ', 'ver.']:
-                if v.startswith(prefix):
-                    v = v[len(prefix):]
-
-            # Split by dots and convert to integers where possible
-            parts = []
-            for part in re.split(r'[.\-_]', v):
-                # Try to extract number from part
-                num_match = re.match(r'(\d+)', part)
-                if num_match:
-                    parts.append(int(num_match.group(1)))
-                    # Handle suffix like "1a" -> (1, 'a')
-                    suffix = part[len(num_match.group(1)):]
-                    if suffix:
-                        parts.append(suffix)
-                elif part:
-                    parts.append(part)
-            return parts
+        # Same version on both sides (the usual case): skip the part-by-part comparison
+        if local.strip().lower() == remote.strip().lower():
+            return 'current' if UpdateChecker.parse_version(local) else None
+
+        # Two plain releases of the same kind compare as packaging Versions. A single
+        # number against a dotted version goes through the scheme checks below
+        local_release = UpdateChecker.parse_release(local)
+        remote_release = UpdateChecker.parse_release(remote)
+        if (local_release is not None and remote_release is not None
+                and (len(local_release.release) == 1) == (len(remote_release.release) == 1)):
+            if local_release < remote_release:
+                return 'update'
+            if local_release > remote_release:
+                return 'newer'
+            return 'current'
 
         try:
-            local_parts = parse_version(local)
-            remote_parts = parse_version(remote)
+            local_parts = UpdateChecker.parse_version(local)
+            remote_parts = UpdateChecker.parse_version(remote)
 
             if not local_parts or not remote_parts:
                 return None
@@ -999,12 +1619,76 @@ class UpdateChecker:
             return None
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+        # Results per page content, see _cached_page_result
+        self._page_cache: OrderedDict[tuple, Optional[str]] = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session for mod pages, created on first use.
+
+        Created under a lock, so worker threads checking pages at once share one session.
+        """
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = make_session(BROWSER_USER_AGENT, pool_size=self.CHECK_WORKERS, retries=2)
+        return self._session
     
-    def check_modthesims(self, mod_url: str) -> Optional[dict]:
+    @staticmethod
+    def _conditional_headers(previous: Optional[dict], url: str) -> dict:
+        """Validators from the last check of url, so an unchanged page comes back as a 304."""
+        if not previous or previous.get('url') != url:
+            return {}
+        headers = {}
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            headers['If-Modified-Since'] = previous['last_modified']
+        return headers
+
+    @staticmethod
+    def _unchanged_info(previous: dict) -> dict:
+        """Reuse the last check's results for a page that answered 304 Not Modified."""
+        return {**previous, 'checked_at': datetime.now().isoformat()}
+
+    @staticmethod
+    def _store_validators(update_info: dict, response: "requests.Response"):
+        """Remember the page's ETag/Last-Modified for the next conditional request."""
+        for key, header in (('etag', 'ETag'), ('last_modified', 'Last-Modified')):
+            value = response.headers.get(header)
+            if value:
+                update_info[key] = value
+
+    def _fetch_page(self, url: str, timeout: int, headers: Optional[dict] = None) -> tuple["requests.Response", str]:
+        """GET a page, reading at most MAX_PAGE_BYTES of it; returns (response, html).
+
+        The html is decoded the way response.text would be. Error responses
+        come back with no html, since their body is never parsed.
+        """
+        with self.session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+            if not response.ok:
+                return response, ''
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(self.PAGE_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= self.MAX_PAGE_BYTES:
+                    break
+        body = b''.join(chunks)[:self.MAX_PAGE_BYTES]
+        encoding = response.encoding
+        if encoding is None:
+            from requests.compat import chardet
+            encoding = chardet.detect(body)['encoding'] if chardet is not None else 'utf-8'
+        try:
+            return response, str(body, encoding or 'utf-8', errors='replace')
+        except (LookupError, TypeError):
+            return response, str(body, errors='replace')
+
+    def check_modthesims(self, mod_url: str, previous: Optional[dict] = None) -> Optional[dict]:
         """Check ModTheSims for mod update info."""
         if not BS4_AVAILABLE:
             return None
@@ -1018,10 +1702,12 @@ class UpdateChecker:
             mod_id = match.group(1)
             url = f"https://modthesims.info/d/{mod_id}"
             
-            response = self.session.get(url, timeout=10)
+            response, html = self._fetch_page(url, timeout=10, headers=self._conditional_headers(previous, url))
+            if response.status_code == 304 and previous:
+                return self._unchanged_info(previous)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(html)
             
             # Try to find update date
             update_info = {}
@@ -1038,9 +1724,9 @@ class UpdateChecker:
                 update_info['last_updated'] = date_elem.get_text(strip=True)
             
             # Look for version info
-            version_elem = soup.find(string=re.compile(r'Version:?\s*[\d.]+'))
+            version_elem = soup.find(string=self.MODTHESIMS_VERSION_RE)
             if version_elem:
-                version_match = re.search(r'Version:?\s*([\d.]+)', str(version_elem))
+                version_match = self.MODTHESIMS_VERSION_RE.search(str(version_elem))
                 if version_match:
                     update_info['version'] = version_match.group(1)
             
@@ -1051,6 +1737,7 @@ class UpdateChecker:
             
             update_info['url'] = url
             update_info['checked_at'] = datetime.now().isoformat()
+            self._store_validators(update_info, response)
             
             return update_info if update_info else None
             
@@ -1064,17 +1751,23 @@ class UpdateChecker:
         # This is a placeholder for future implementation
         return None
 
-    def check_generic(self, mod_url: str) -> Optional[dict]:
+    def check_generic(self, mod_url: str, previous: Optional[dict] = None) -> Optional[dict]:
         """Check any URL for mod update info using generic patterns."""
         if not BS4_AVAILABLE:
             return None
 
+        from urllib.parse import urlparse
+
         try:
-            response = self.session.get(mod_url, timeout=15)
+            response, html = self._fetch_page(mod_url, timeout=15, headers=self._conditional_headers(previous, mod_url))
+            if response.status_code == 304 and previous:
+                return self._unchanged_info(previous)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = make_soup(html, self.GENERIC_PAGE_TAGS)
             update_info: dict[str, str] = {}
+            # Parsed once for following links and building download page URLs
+            parsed_url = urlparse(mod_url)
 
             # Get page title
             title_elem = soup.find('title')
@@ -1094,7 +1787,7 @@ class UpdateChecker:
                     update_info['title'] = h1_text
 
             # Search for version info on main page
-            version = self._find_version(soup)
+            version = self._page_version(html, get_soup=lambda: soup)
             if version:
                 update_info['version'] = version
 
@@ -1110,35 +1803,40 @@ class UpdateChecker:
                 update_info['download_text'] = download_info.get('text', '')
 
             # If no version found on main page, try following download link
+            followed_download = False
             if not update_info.get('version') and download_info and download_info.get('url'):
                 download_url = download_info['url']
                 debug_print(f"      DEBUG: Following download link: {download_url}")
                 # Only follow if it's on the same domain or a known mod hosting site
-                if self._should_follow_link(mod_url, download_url):
+                if self._should_follow_link(parsed_url.netloc.lower(), download_url):
                     try:
-                        dl_response = self.session.get(download_url, timeout=15)
+                        dl_response, dl_html = self._fetch_page(download_url, timeout=15)
                         dl_response.raise_for_status()
-                        dl_soup = BeautifulSoup(dl_response.text, 'html.parser')
+                        followed_download = True
+
+                        # Parsed at most once, and only if the version or date search needs it
+                        dl_soup = cache(lambda: make_soup(dl_html, self.GENERIC_PAGE_TAGS))
 
                         # Search for version on download page
-                        dl_version = self._find_version(dl_soup)
+                        dl_version = self._page_version(dl_html, get_soup=dl_soup)
                         debug_print(f"      DEBUG: Version from download page: {dl_version}")
                         if dl_version:
                             update_info['version'] = dl_version
 
                         # Also check for date if not found
                         if not update_info.get('last_updated'):
-                            dl_date = self._find_date(dl_soup)
+                            dl_date = self._page_date(dl_html, get_soup=dl_soup)
                             if dl_date:
                                 update_info['last_updated'] = dl_date
                     except Exception:
                         pass  # Failed to fetch download page, continue with what we have
 
-            # If still no version, try common download page paths
-            if not update_info.get('version'):
-                from urllib.parse import urlparse, urljoin
-                parsed = urlparse(mod_url)
-                base = f"{parsed.scheme}://{parsed.netloc}"
+            # If still no version, try common download page paths. Skipped when the page's
+            # own download link was followed: the common paths rarely know better, and
+            # probing them costs up to 8 more requests per mod
+            if not update_info.get('version') and not followed_download:
+                from urllib.parse import urljoin
+                base = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
                 # Common download page paths to try
                 download_paths = [
@@ -1153,10 +1851,15 @@ class UpdateChecker:
                         if test_url == mod_url:
                             continue  # Skip if same as original URL
 
-                        test_response = self.session.get(test_url, timeout=10)
+                        # Probe with HEAD so missing paths cost no page download; servers
+                        # that don't support HEAD (405/501) still get the GET
+                        head_response = self.session.head(test_url, timeout=5, allow_redirects=True)
+                        if head_response.status_code >= 400 and head_response.status_code not in (405, 501):
+                            continue
+
+                        test_response, test_html = self._fetch_page(test_url, timeout=10)
                         if test_response.status_code == 200:
-                            test_soup = BeautifulSoup(test_response.text, 'html.parser')
-                            test_version = self._find_version(test_soup)
+                            test_version = self._page_version(test_html)
                             debug_print(f"      DEBUG: {path} -> {test_version}")
                             if test_version:
                                 update_info['version'] = test_version
@@ -1169,6 +1872,7 @@ class UpdateChecker:
 
             update_info['url'] = mod_url
             update_info['checked_at'] = datetime.now().isoformat()
+            self._store_validators(update_info, response)
 
             # Only return if we found something useful
             if update_info.get('version') or update_info.get('last_updated') or update_info.get('download_url'):
@@ -1184,120 +1888,137 @@ class UpdateChecker:
             print(f"Error checking URL: {e}")
             return None
 
-    def _should_follow_link(self, base_url: str, link_url: str) -> bool:
+    def _should_follow_link(self, base_netloc: str, link_url: str) -> bool:
         """Determine if we should follow a link to check for version info."""
         from urllib.parse import urlparse
 
-        base_domain = urlparse(base_url).netloc.lower()
-        link_domain = urlparse(link_url).netloc.lower()
+        parsed_link = urlparse(link_url)
 
         # Always follow links on same domain
-        if base_domain == link_domain:
+        if base_netloc == parsed_link.netloc.lower():
             return True
 
-        # Follow links to known mod hosting domains
-        known_domains = [
-            'wonderfulwhims.com', 'deaderpool-mccc.com', 'modthesims.info',
-            'patreon.com', 'simfileshare.net', 'mediafire.com',
-            'mega.nz', 'github.com', 'curseforge.com'
-        ]
-        for domain in known_domains:
-            if domain in link_domain:
-                return True
+        # Follow links to known mod hosting domains and their subdomains
+        host = parsed_link.hostname or ''
+        return any(host == domain or host.endswith('.' + domain) for domain in self.KNOWN_MOD_HOSTS)
 
-        return False
-
-    def _find_version(self, soup: "BeautifulSoup") -> Optional[str]:
-        """Find version number on the page using multiple strategies."""
-        version_pattern = re.compile(r'version', re.IGNORECASE)
-        year_based_pattern = re.compile(r'^20\d{2}\.\d+\.\d+$')
+    def _find_version(self, page) -> Optional[str]:
+        """Find version number on the page using multiple strategies.
 
+        page is a BeautifulSoup soup, or an lxml tree from make_tree.
+        """
         # Collect all found versions, then pick the best one
         found_versions: list[tuple[int, str]] = []  # (priority, version)
 
         def add_version(version: str, priority: int):
             """Add a version with priority (lower is better)."""
             # Year-based versions get highest priority (0)
-            if year_based_pattern.match(version):
+            if self.YEAR_VERSION_RE.match(version):
                 found_versions.append((0, version))
             else:
                 found_versions.append((priority, version))
 
-        # Elements to search for version info
-        version_elements = ['span', 'div', 'p', 'td', 'dd', 'strong', 'h1', 'h2', 'h3', 'h4', 'a', 'b', 'em']
+        # The strategies only need tag names, attributes, text and the first heading
+        # inside an element, which both kinds of tree provide
+        if lxml_html is not None and isinstance(page, lxml_html.HtmlElement):
+            elements = ((elem.tag, elem) for elem in page.iter() if isinstance(elem.tag, str))
+            meta_tags = page.iter('meta')
+            strings = page.itertext()
+            get_text = self._tree_text
+            def first_header(elem):
+                return next(elem.iterdescendants(*self.CHANGELOG_HEADERS), None)
+        else:
+            # Lazy walks (strings have no name), so a Strategy 0 answer skips them
+            elements = ((elem.name, elem) for elem in page.descendants if elem.name is not None)
+            meta_tags = (elem for elem in page.descendants if elem.name == 'meta')
+            strings = page.strings
+            def get_text(elem, strip=False):
+                return elem.get_text(strip=strip)
+            def first_header(elem):
+                return elem.find(list(self.CHANGELOG_HEADERS))
 
         # Strategy 0: Early scan for year-based versions in page text (priority 0)
         # This ensures MCCC-style versions like "2025.7.0" are always found
-        page_text = soup.get_text()[:8000]
-        year_version_pattern = re.compile(r'\b(20\d{2}\.\d+\.\d+)\b')
-        year_matches = year_version_pattern.findall(page_text)
-        for version in set(year_matches):
+        page_text = self._text_head(strings, 8000)
+        year_versions = set(self.YEAR_VERSION_TEXT_RE.findall(page_text))
+        for version in year_versions:
             add_version(version, 0)
 
-        # Strategy 1: Look for elements with version-related classes or IDs (priority 1)
-        for elem in soup.find_all(version_elements):
-            class_attr = elem.get('class')
-            class_str = ' '.join(class_attr) if isinstance(class_attr, list) else ''
-            id_attr = elem.get('id')
-            id_str = str(id_attr) if id_attr else ''
-
-            if version_pattern.search(class_str) or version_pattern.search(id_str):
-                text = elem.get_text(strip=True)
-                if text and len(text) < 50:
-                    for pattern in self.VERSION_PATTERNS:
-                        match = pattern.search(text)
-                        if match:
-                            add_version(match.group(1), 1)
-                            break
-
-        # Strategy 2: Look for headings (priority 2)
-        for elem in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5']):
-            text = elem.get_text(strip=True)
-            if text and len(text) < 100:
-                for pattern in self.VERSION_PATTERNS:
-                    match = pattern.search(text)
-                    if match:
-                        add_version(match.group(1), 2)
-                        break
-
-        # Strategy 3: Look for elements containing version keywords (priority 3)
-        for elem in soup.find_all(version_elements + ['li', 'dt']):
-            text = elem.get_text(strip=True)
-            text_lower = text.lower()
-            for keyword in self.VERSION_KEYWORDS:
-                if keyword in text_lower and len(text) < 100:
-                    for pattern in self.VERSION_PATTERNS:
-                        match = pattern.search(text)
-                        if match:
-                            add_version(match.group(1), 3)
-                            break
-                    break
-
-        # Strategy 4: Look in meta tags (priority 2)
-        for meta in soup.find_all('meta'):
-            name = str(meta.get('name', '')).lower()
-            prop = str(meta.get('property', '')).lower()
-            if 'version' in name or 'version' in prop:
-                content = meta.get('content')
-                if content:
-                    add_version(str(content), 2)
-
-        # Strategy 5: Search changelog/release sections (priority 1 - reliable source)
-        changelog_keywords = ['changelog', 'release notes', 'what\'s new', 'updates', 'history', 'releases']
-        for elem in soup.find_all(['section', 'div', 'article']):
-            elem_id = str(elem.get('id', '')).lower()
-            class_attr = elem.get('class')
-            elem_class = ' '.join(class_attr).lower() if isinstance(class_attr, list) else ''
-            header = elem.find(['h1', 'h2', 'h3', 'h4'])
-            header_text = header.get_text(strip=True).lower() if header else ''
-
-            if any(kw in elem_id or kw in elem_class or kw in header_text for kw in changelog_keywords):
-                text = elem.get_text()[:500]
-                for pattern in self.VERSION_PATTERNS:
-                    match = pattern.search(text)
-                    if match:
-                        add_version(match.group(1), 1)
-                        break
+        # A year-based version beats everything else, so the newest one found here is
+        # the answer unless the walk below could turn up a newer one. Every version
+        # the walk can find is in the page text once whitespace is removed (element
+        # text joins stripped strings), so it can't when the whole page text was
+        # scanned, no year-like run of digits there (e.g. the "2025.8.0" in
+        # "v2025.8.0") is newer, and no meta tag holds a year version
+        if year_versions and len(page_text) < 8000:
+            best = max(year_versions, key=self._year_version_parts)
+            compact_text = ''.join(page_text.split())
+            newer_in_text = any(
+                self._year_version_parts(version) > self._year_version_parts(best)
+                for version in self.YEAR_VERSION_ANYWHERE_RE.findall(compact_text)
+            )
+            if not newer_in_text and not any(
+                    self.YEAR_VERSION_RE.match(str(meta.get('content') or '')) for meta in meta_tags):
+                return best
+
+        # Strategies 1-5 share one walk over the tree, dispatching on the tag name
+        for tag, elem in elements:
+            # Strategy 4: Look in meta tags (priority 2)
+            if tag == 'meta':
+                name = str(elem.get('name', '')).lower()
+                prop = str(elem.get('property', '')).lower()
+                if 'version' in name or 'version' in prop:
+                    content = elem.get('content')
+                    if content:
+                        add_version(str(content), 2)
+                continue
+
+            text = None  # Stripped element text, shared by strategies 1-3
+
+            # Strategy 1: Look for elements with version-related classes or IDs (priority 1)
+            if tag in self.VERSION_ELEMENTS:
+                class_str = self._class_string(elem)
+                id_attr = elem.get('id')
+                id_str = str(id_attr) if id_attr else ''
+
+                if self.VERSION_ATTR_RE.search(class_str) or self.VERSION_ATTR_RE.search(id_str):
+                    text = get_text(elem, strip=True)
+                    if text and len(text) < 50:
+                        version = self._match_version(text)
+                        if version:
+                            add_version(version, 1)
+
+            # Strategy 2: Look for headings (priority 2)
+            if tag in self.HEADING_TAGS:
+                if text is None:
+                    text = get_text(elem, strip=True)
+                if text and len(text) < 100:
+                    version = self._match_version(text)
+                    if version:
+                        add_version(version, 2)
+
+            # Strategy 3: Look for elements containing version keywords (priority 3)
+            if tag in self.KEYWORD_ELEMENTS:
+                if text is None:
+                    text = get_text(elem, strip=True)
+                text_lower = text.lower()
+                if len(text) < 100 and self.VERSION_KEYWORDS_RE.search(text_lower):
+                    version = self._match_version(text)
+                    if version:
+                        add_version(version, 3)
+
+            # Strategy 5: Search changelog/release sections (priority 1 - reliable source)
+            if tag in self.CHANGELOG_CONTAINERS:
+                elem_id = str(elem.get('id', '')).lower()
+                elem_class = self._class_string(elem).lower()
+                header = first_header(elem)
+                header_text = get_text(header, strip=True).lower() if header is not None else ''
+
+                changelog_re = self.CHANGELOG_KEYWORDS_RE
+                if changelog_re.search(elem_id) or changelog_re.search(elem_class) or changelog_re.search(header_text):
+                    version = self._match_version(get_text(elem)[:500])
+                    if version:
+                        add_version(version, 1)
 
         # If we found versions, return the best one
         if found_versions:
@@ -1305,7 +2026,7 @@ class UpdateChecker:
             def version_sort_key(item: tuple[int, str]) -> tuple:
                 priority, version = item
                 # Year-based versions: sort by version number descending
-                if year_based_pattern.match(version):
+                if self.YEAR_VERSION_RE.match(version):
                     try:
                         parts = [int(p) for p in version.split('.')]
                         return (priority, 0, tuple(-p for p in parts))
@@ -1320,20 +2041,102 @@ class UpdateChecker:
 
             found_versions.sort(key=version_sort_key)
 
-            # Debug: show what versions were found (always show if more than 1 version)
-            if len(found_versions) > 1:
+            # Debug: show what versions were found (when more than 1 version). Checked
+            # against DEBUG here rather than in debug_print so the dedup is skipped too
+            if DEBUG and len(found_versions) > 1:
                 unique_versions = list(dict.fromkeys([v for _, v in found_versions]))[:10]
                 debug_print(f"      DEBUG versions found: {unique_versions}")
 
             return found_versions[0][1]
 
         # Strategy 6: Fall back to scanning full page text (priority 5)
-        page_text = soup.get_text()[:5000]
+        return self._match_version(page_text[:5000])
+
+    @staticmethod
+    def _year_version_parts(version: str) -> tuple[int, ...]:
+        """Numeric parts of a year-based version, for finding the newest one."""
+        return tuple(int(part) for part in version.split('.'))
+
+    @staticmethod
+    def _text_head(strings: Iterable[str], limit: int) -> str:
+        """Return ''.join(strings)[:limit] without joining the text of the whole page."""
+        parts = []
+        total = 0
+        for text in strings:
+            parts.append(text)
+            total += len(text)
+            if total >= limit:
+                break
+        return ''.join(parts)[:limit]
+
+    @staticmethod
+    def _tree_text(elem: "lxml_html.HtmlElement", strip: bool = False) -> str:
+        """An lxml element's text, like BeautifulSoup's get_text(strip=strip)."""
+        if strip:
+            return ''.join(text.strip() for text in elem.itertext())
+        return ''.join(elem.itertext())
+
+    @staticmethod
+    def _class_string(elem) -> str:
+        """An element's classes, space-separated, from either kind of tree."""
+        class_attr = elem.get('class')
+        if isinstance(class_attr, list):
+            return ' '.join(class_attr)
+        return ' '.join(class_attr.split()) if class_attr else ''
+
+    def _page_version(self, markup: str, get_soup: Optional[Callable[[], "BeautifulSoup"]] = None) -> Optional[str]:
+        """Find the version on a page from its HTML (cached by page content).
+
+        Searches an lxml tree when lxml is installed. Otherwise it uses the soup from
+        get_soup, so a caller that already parsed the page doesn't parse it again.
+        """
+        def find(markup: str) -> Optional[str]:
+            tree = make_tree(markup, self.GENERIC_PAGE_TAGS)
+            if tree is not None:
+                return self._find_version(tree)
+            return self._find_version(get_soup() if get_soup else make_soup(markup, self.GENERIC_PAGE_TAGS))
+        return self._cached_page_result('version', markup, find)
+
+    def _page_date(self, markup: str, get_soup: Optional[Callable[[], "BeautifulSoup"]] = None) -> Optional[str]:
+        """Find the update date on a page from its HTML (cached by page content).
+
+        Uses the soup from get_soup if given, rather than parsing the page again.
+        """
+        def find(markup: str) -> Optional[str]:
+            return self._find_date(get_soup() if get_soup else make_soup(markup, self.GENERIC_PAGE_TAGS))
+        return self._cached_page_result('date', markup, find)
+
+    def _cached_page_result(self, kind: str, markup: str, find) -> Optional[str]:
+        """Return find(markup), reusing the result for a page already seen this session.
+
+        Mods often share download portals, so the same page comes back while
+        checking different URLs. Keyed by the HTML itself, so two pages can never
+        share an entry the way they could with a hash.
+        """
+        key = (kind, markup)
+        with self._page_cache_lock:
+            if key in self._page_cache:
+                self._page_cache.move_to_end(key)
+                return self._page_cache[key]
+        result = find(markup)
+        with self._page_cache_lock:
+            self._page_cache[key] = result
+            if len(self._page_cache) > self.PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+        return result
+
+    def _match_version(self, text: str) -> Optional[str]:
+        """Return the version captured by the first matching VERSION_PATTERNS entry."""
+        # Every pattern but "v58" needs a dot, and that one needs a v, so text with
+        # neither is ruled out by substring checks before any regex runs
+        if '.' not in text and 'v' not in text and 'V' not in text:
+            return None
+        if not self.VERSION_PATTERNS_RE.search(text):
+            return None
         for pattern in self.VERSION_PATTERNS:
-            match = pattern.search(page_text)
+            match = pattern.search(text)
             if match:
                 return match.group(1)
-
         return None
 
     def _find_date(self, soup: "BeautifulSoup") -> Optional[str]:
@@ -1349,19 +2152,17 @@ class UpdateChecker:
                 return time_text
 
         # Look for elements containing update-related keywords
-        update_keywords = ['updated', 'modified', 'released', 'published', 'last update']
         for elem in soup.find_all(['span', 'div', 'p', 'td', 'li']):
             elem_text = elem.get_text(strip=True).lower()
-            for keyword in update_keywords:
-                if keyword in elem_text and len(elem_text) < 100:
-                    # Try to extract a date from this element
-                    for pattern in self.DATE_PATTERNS[1:]:  # Skip first pattern (used differently)
-                        match = pattern.search(elem.get_text())
-                        if match:
-                            return match.group(1)
-                    # Return the whole text if it's short enough
-                    if len(elem_text) < 50:
-                        return elem.get_text(strip=True)
+            if len(elem_text) < 100 and self.UPDATE_KEYWORDS_RE.search(elem_text):
+                # Try to extract a date from this element
+                for pattern in self.DATE_PATTERNS[1:]:  # Skip first pattern (used differently)
+                    match = pattern.search(elem.get_text())
+                    if match:
+                        return match.group(1)
+                # Return the whole text if it's short enough
+                if len(elem_text) < 50:
+                    return elem.get_text(strip=True)
 
         return None
 
@@ -1369,58 +2170,54 @@ class UpdateChecker:
         """Find download button or link on the page."""
         from urllib.parse import urljoin
 
-        def check_element(elem, keywords: list[str]) -> Optional[dict]:
-            """Check if element matches any keyword and return download info."""
-            elem_text = elem.get_text(strip=True).lower()
+        def matches(keywords_re: re.Pattern, *fields: str) -> bool:
+            """Check if any keyword appears in any of the element's fields."""
+            return any(keywords_re.search(field) for field in fields)
+
+        # One pass over links and buttons. A primary keyword (download, direct link) wins
+        # outright; otherwise the first secondary keyword (get it, grab, install) match,
+        # and as a last resort the first link to a common download file type
+        secondary = None
+        by_extension = None
+        for elem in soup.find_all(['a', 'button']):
+            href_attr = elem.get('href')
+            if not href_attr:
+                continue
+            href = str(href_attr)
+            href_lower = href.lower()
+            text = elem.get_text(strip=True)
+            elem_text = text.lower()
             class_attr = elem.get('class')
             elem_class = ' '.join(class_attr).lower() if isinstance(class_attr, list) else ''
             id_attr = elem.get('id')
             elem_id = str(id_attr).lower() if id_attr else ''
-            href_attr = elem.get('href')
-            href_lower = str(href_attr).lower() if href_attr else ''
-
-            for keyword in keywords:
-                if keyword in elem_text or keyword in elem_class or keyword in elem_id or keyword in href_lower:
-                    if href_attr:
-                        return {
-                            'url': urljoin(base_url, str(href_attr)),
-                            'text': elem.get_text(strip=True)
-                        }
-            return None
 
-        # First pass: look for primary keywords (download, direct link)
-        for elem in soup.find_all(['a', 'button']):
-            result = check_element(elem, self.DOWNLOAD_KEYWORDS_PRIMARY)
-            if result:
-                return result
-
-        # Second pass: look for secondary keywords (get it, grab, install)
-        for elem in soup.find_all(['a', 'button']):
-            result = check_element(elem, self.DOWNLOAD_KEYWORDS_SECONDARY)
-            if result:
-                return result
-
-        # Last resort: look for links to common download file types
-        download_extensions = ['.zip', '.rar', '.7z', '.package', '.ts4script']
-        for link in soup.find_all('a', href=True):
-            href_attr = link.get('href')
-            href = str(href_attr).lower() if href_attr else ''
-            for ext in download_extensions:
-                if href.endswith(ext):
-                    return {
-                        'url': urljoin(base_url, str(link['href'])),
-                        'text': link.get_text(strip=True) or f'Download {ext}'
+            if matches(self.DOWNLOAD_KEYWORDS_PRIMARY_RE, elem_text, elem_class, elem_id, href_lower):
+                return {'url': urljoin(base_url, href), 'text': text}
+            if secondary is None and matches(
+                    self.DOWNLOAD_KEYWORDS_SECONDARY_RE, elem_text, elem_class, elem_id, href_lower):
+                secondary = {'url': urljoin(base_url, href), 'text': text}
+            if by_extension is None and secondary is None and elem.name == 'a':
+                ext_match = self.DOWNLOAD_EXTENSION_RE.search(href)
+                if ext_match:
+                    by_extension = {
+                        'url': urljoin(base_url, href),
+                        'text': text or f'Download .{ext_match.group(1).lower()}'
                     }
 
-        return None
+        return secondary or by_extension
+
+    def check_url(self, mod_url: str, previous: Optional[dict] = None) -> Optional[dict]:
+        """Check any URL for mod info, using site-specific checker if available.
 
-    def check_url(self, mod_url: str) -> Optional[dict]:
-        """Check any URL for mod info, using site-specific checker if available."""
+        previous is the result of the last check of this URL; when the page
+        hasn't changed since, it is returned (with a new checked_at) unparsed.
+        """
         url_lower = mod_url.lower()
 
         # Use site-specific checkers when available
         if 'modthesims' in url_lower:
-            result = self.check_modthesims(mod_url)
+            result = self.check_modthesims(mod_url, previous)
             if result:
                 return result
 
@@ -1430,7 +2227,21 @@ class UpdateChecker:
                 return result
 
         # Fall back to generic checker
-        return self.check_generic(mod_url)
+        return self.check_generic(mod_url, previous)
+
+    def check_urls(self, urls: list[str], previous: Optional[dict[str, dict]] = None,
+                   max_workers: Optional[int] = None) -> dict[str, Optional[dict]]:
+        """Check several URLs concurrently, returning each URL's check_url result.
+
+        previous maps URLs to the results of their last check (see check_url).
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+        previous = previous or {}
+        with ThreadPoolExecutor(max_workers=max_workers or self.CHECK_WORKERS) as executor:
+            results = executor.map(lambda url: self.check_url(url, previous.get(url)), unique_urls)
+            return dict(zip(unique_urls, results))
 
 
 # ============================================================================
@@ -1453,10 +2264,14 @@ class ModUpdater:
         self.mods_path = mods_path
         self.staging_path = mods_path / "_UpdateStaging"
         self.backup_path = mods_path / self.BACKUP_FOLDER
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self._session: Optional["requests.Session"] = None
+
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP session for mod downloads, created on first use."""
+        if self._session is None:
+            self._session = make_session(BROWSER_USER_AGENT)
+        return self._session
 
     def requires_login(self, url: str) -> bool:
         """Check if URL requires login to download."""
@@ -1840,28 +2655,56 @@ class ModUpdater:
 class SimsModManager:
     """Main mod manager class that ties everything together."""
 
+    # How long check_for_updates trusts a page's last results before fetching it again
+    UPDATE_CHECK_TTL = timedelta(hours=6)
+
+    # Read size when backups copy files in Python (see _copy_backup_file)
+    BACKUP_BUFFER_SIZE = 4 * 1024 * 1024
+
+    # Number listings debug_mod_version prints for version-named archive members,
+    # taken from the start of each member where version strings usually sit
+    DEBUG_NUMBER_RE = re.compile(rb'[^\d](\d{2,3})[^\d]')
+    DEBUG_VERSION_LIKE_RE = re.compile(rb'(\d+\.\d+(?:\.\d+)?)')
+    DEBUG_SCAN_BYTES = 64 * 1024
+
     def __init__(self, mods_path: Optional[Path] = None):
         self.mods_path = mods_path or get_default_mods_path()
         self.db = ModDatabase(self.mods_path)
         self.scanner = ModScanner(self.mods_path)
         self.update_checker = UpdateChecker()
         self.mod_updater = ModUpdater(self.mods_path)
+        # (lowercase name, hash) per mod for name searches, see _mods_by_name
+        self._name_index: Optional[list[tuple[str, str]]] = None
 
         console.print(f"[bold]Mods folder:[/bold] {self.mods_path}")
         status = "[green]Found[/green]" if self.mods_path.exists() else "[red]Not found[/red]"
         console.print(f"[bold]Status:[/bold] {status}")
         console.print()
     
-    def scan_mods(self) -> list[dict]:
-        """Scan all mods and update the database."""
+    def scan_mods(self, force: bool = False) -> list[dict]:
+        """Scan all mods and update the database (force re-reads unchanged files)."""
         with console.status("[bold green]Scanning mods folder...", spinner="dots"):
-            mods = self.scanner.scan()
+            # Entries keyed by an older hash algorithm can't be found by hash,
+            # so match them by path to carry user metadata over
+            legacy_by_path = {}
+            known_mods = {}
+            if self.db.data.get('hash_algorithm') != ModScanner.HASH_ALGORITHM:
+                legacy_by_path = {m['path']: m for m in self.db.data["mods"].values()}
+                self.db.data['hash_algorithm'] = ModScanner.HASH_ALGORITHM
+            else:
+                known_mods = {m['path']: m for m in self.db.data["mods"].values()}
+
+            mods = self.scanner.scan(known_mods, force=force)
 
             # Update database with scanned mods
             current_hashes = set()
+            migrated_hashes = set()
             for mod in mods:
                 current_hashes.add(mod['hash'])
                 existing = self.db.get_mod(mod['hash'])
+                if not existing and mod['path'] in legacy_by_path:
+                    existing = legacy_by_path[mod['path']]
+                    migrated_hashes.add(existing['hash'])
 
                 if existing:
                     # Preserve user-added metadata
@@ -1870,17 +2713,25 @@ class SimsModManager:
                     mod['creator'] = existing.get('creator')
                     mod['added_date'] = existing.get('added_date', mod['modified_date'])
                     mod['last_checked'] = existing.get('last_checked')
+                    # Last check's results: reused within UPDATE_CHECK_TTL, and their
+                    # ETag/Last-Modified make the next fetch a conditional request
+                    mod['remote_info'] = existing.get('remote_info')
                 else:
                     mod['added_date'] = datetime.now().isoformat()
+                    # Same keys a rescan fills in, so the next scan finds the entry unchanged
+                    for key in ('source_url', 'notes', 'creator', 'last_checked', 'remote_info'):
+                        mod[key] = None
 
                 self.db.add_mod(mod['hash'], mod)
 
             # Remove mods that no longer exist
-            removed = []
-            for file_hash in list(self.db.data["mods"].keys()):
-                if file_hash not in current_hashes:
-                    removed.append(self.db.data["mods"][file_hash]['name'])
-                    self.db.remove_mod(file_hash)
+            stale_hashes = self.db.data["mods"].keys() - current_hashes
+            removed = [self.db.data["mods"][h]['name'] for h in stale_hashes - migrated_hashes]
+            for file_hash in stale_hashes:
+                self.db.remove_mod(file_hash)
+
+            self.db.flush()
+            self._name_index = None
 
         # Show results
         script_count = sum(1 for m in mods if m['is_script'])
@@ -1894,14 +2745,29 @@ class SimsModManager:
 
         return mods
 
+    def _mods_by_name(self) -> list[tuple[str, str]]:
+        """(lowercase name, hash) for every mod, lowered once per scan rather than per search."""
+        if self._name_index is None:
+            self._name_index = [(m['name'].lower(), h) for h, m in self.db.data["mods"].items()]
+        return self._name_index
+
     def debug_mod_version(self, mod_name: str):
         """Debug version detection for a specific mod."""
+        # The report can run to hundreds of lines, so it's collected and written in
+        # one go instead of flushing the console line by line
+        buffer = io.StringIO()
+        try:
+            with redirect_stdout(buffer):
+                self._print_version_debug(mod_name)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+
+    def _print_version_debug(self, mod_name: str):
+        """Print debug_mod_version's report."""
         # Find mod by name
-        found = None
-        for file_hash, mod in self.db.data["mods"].items():
-            if mod_name.lower() in mod['name'].lower():
-                found = mod
-                break
+        pattern = mod_name.lower()
+        found = next((self.db.data["mods"][h] for name, h in self._mods_by_name() if pattern in name), None)
 
         if not found:
             print(f"Mod '{mod_name}' not found. Run a scan first.")
@@ -1916,7 +2782,8 @@ class SimsModManager:
         print(f"Current local_version: {found.get('local_version', 'None')}")
 
         file_path = Path(found['full_path'])
-        if not file_path.exists():
+        # Script mods learn whether the file is there from opening the archive below
+        if not found['is_script'] and not file_path.exists():
             print(f"File not found at {file_path}")
             return
 
@@ -1937,58 +2804,75 @@ class SimsModManager:
                     if len(file_list) > 30:
                         print(f"  ... and {len(file_list) - 30} more")
 
+                    # Sort the members into each section's list in one pass. Every
+                    # version file name ('version.txt', '__version__', 'mod_version.txt'...)
+                    # contains "version", so that is all the basename check needs
+                    version_file_candidates = []
+                    py_files = []
+                    pyc_files = []
+                    version_files_found = []
+                    for name in file_list:
+                        name_lower = name.lower()
+                        if 'version' in name_lower:
+                            version_files_found.append(name)
+                            if 'version' in name_lower.rsplit('/', 1)[-1]:
+                                version_file_candidates.append(name)
+                        if name.endswith('.py'):
+                            py_files.append(name)
+                        elif name.endswith('.pyc'):
+                            pyc_files.append(name)
+
                     # Look for version files
                     print(f"\n--- Searching for version info ---")
-                    version_files = ['version.txt', 'VERSION', '__version__', 'mod_version.txt']
-                    for name in file_list:
-                        basename = name.split('/')[-1].lower()
-                        for vf in version_files:
-                            if vf.lower() in basename:
-                                print(f"Found potential version file: {name}")
-                                try:
-                                    content = zf.read(name).decode('utf-8', errors='ignore')[:200]
-                                    print(f"  Content: {repr(content)}")
-                                except Exception as e:
-                                    print(f"  Error reading: {e}")
+                    for name in version_file_candidates:
+                        print(f"Found potential version file: {name}")
+                        try:
+                            content = self.scanner._read_member_head(zf, name).decode('utf-8', errors='ignore')[:200]
+                            print(f"  Content: {repr(content)}")
+                        except Exception as e:
+                            print(f"  Error reading: {e}")
 
                     # Search for version patterns in Python source files
                     print(f"\n--- Searching Python source files (.py) ---")
                     py_found = False
-                    for name in file_list:
-                        if name.endswith('.py'):
-                            try:
-                                content = zf.read(name)[:1000]
-                                for pattern in self.scanner.CONTENT_VERSION_PATTERNS[:5]:
-                                    match = pattern.search(content)
-                                    if match:
-                                        result = match.group(1).decode('utf-8', errors='ignore')
-                                        print(f"  Found in {name}: {result}")
-                                        py_found = True
-                                        break
-                            except Exception:
-                                pass
+                    for name in py_files:
+                        try:
+                            content = self.scanner._read_member_head(zf, name, 1000)
+                            if not self.scanner.ASSIGNED_VERSION_RE.search(content):
+                                continue
+                            for pattern in self.scanner.ASSIGNED_VERSION_PATTERNS:
+                                match = pattern.search(content)
+                                if match:
+                                    result = match.group(1).decode('utf-8', errors='ignore')
+                                    print(f"  Found in {name}: {result}")
+                                    py_found = True
+                                    break
+                        except Exception:
+                            pass
                     if not py_found:
                         print("  No version patterns found in .py files")
 
                     # Search files with "version" in the name
                     print(f"\n--- Searching files with 'version' in name ---")
-                    version_files_found = [n for n in file_list if 'version' in n.lower()]
+                    pyc_contents = {}  # Version-named .pyc members already read, for the .pyc section
                     for name in version_files_found:
                         print(f"  Found: {name}")
                         try:
                             content = zf.read(name)
+                            head = content[:self.DEBUG_SCAN_BYTES]
                             # Search for raw ASCII digit sequences that could be versions
                             # Look for 2-digit numbers that aren't likely to be other things
-                            digit_matches = re.findall(rb'[^\d](\d{2,3})[^\d]', content)
+                            digit_matches = self.DEBUG_NUMBER_RE.findall(head)
                             if digit_matches:
-                                unique_digits = list(set(d.decode() for d in digit_matches if 10 <= int(d) <= 999))
+                                # Deduplicated as bytes, so repeats aren't parsed and decoded again
+                                unique_digits = [d.decode() for d in set(digit_matches) if 10 <= int(d) <= 999]
                                 if unique_digits:
                                     print(f"    2-3 digit numbers found: {unique_digits[:15]}")
 
                             # Look for version-like strings
-                            version_matches = re.findall(rb'(\d+\.\d+(?:\.\d+)?)', content)
+                            version_matches = self.DEBUG_VERSION_LIKE_RE.findall(head)
                             if version_matches:
-                                unique_versions = list(set(v.decode() for v in version_matches))
+                                unique_versions = [v.decode() for v in set(version_matches)]
                                 print(f"    Version-like strings: {unique_versions[:10]}")
 
                             # Try RAW_VERSION_PATTERNS
@@ -1999,6 +2883,7 @@ class SimsModManager:
 
                             # Try aggressive .pyc extraction for version-named files
                             if name.endswith('.pyc'):
+                                pyc_contents[name] = content
                                 aggressive_version = self.scanner._version_from_pyc_aggressive(content)
                                 if aggressive_version:
                                     print(f"    AGGRESSIVE .pyc extraction: {aggressive_version}")
@@ -2013,28 +2898,47 @@ class SimsModManager:
 
                     # Search compiled Python files (.pyc)
                     print(f"\n--- Searching compiled Python files (.pyc) ---")
-                    pyc_files = [n for n in file_list if n.endswith('.pyc')]
                     print(f"  Found {len(pyc_files)} .pyc files")
 
                     pyc_found = False
-                    for name in pyc_files[:5]:  # Check first 5 .pyc files
-                        try:
-                            pyc_data = zf.read(name)
-                            version = self.scanner._version_from_pyc(pyc_data)
-                            if version:
-                                print(f"  Found version in {name}: {version}")
-                                pyc_found = True
-                        except Exception as e:
-                            print(f"  Error reading {name}: {e}")
+                    pyc_names = pyc_files[:5]  # Check first 5 .pyc files
+                    if pyc_names:
+                        # Decompressed and searched in parallel, reported in archive order
+                        with ThreadPoolExecutor(max_workers=len(pyc_names)) as executor:
+                            results = executor.map(
+                                lambda n: self._pyc_version(file_path, n, pyc_contents.get(n)), pyc_names)
+                            for name, (version, error) in zip(pyc_names, results):
+                                if error:
+                                    print(f"  Error reading {name}: {error}")
+                                elif version:
+                                    print(f"  Found version in {name}: {version}")
+                                    pyc_found = True
 
                     if not pyc_found:
                         print("  No version extracted from .pyc files via marshal")
 
+            except FileNotFoundError:
+                print(f"File not found at {file_path}")
             except zipfile.BadZipFile:
                 print("Error: Not a valid ZIP file")
             except Exception as e:
                 print(f"Error: {e}")
     
+    def _pyc_version(self, file_path: Path, name: str,
+                     pyc_data: Optional[bytes] = None) -> tuple[Optional[str], Optional[Exception]]:
+        """Version from one .pyc in a .ts4script as (version, error).
+
+        Unless its contents are passed in, the member is read through a new handle
+        on the archive, so several can run on worker threads.
+        """
+        try:
+            if pyc_data is None:
+                with zipfile.ZipFile(file_path, 'r') as zf:
+                    pyc_data = zf.read(name)
+            return self.scanner._version_from_pyc(pyc_data), None
+        except Exception as e:
+            return None, e
+
     def list_mods(self, show_details: bool = False):
         """List all tracked mods."""
         mods = list(self.db.data["mods"].values())
@@ -2043,16 +2947,9 @@ class SimsModManager:
             console.print("[yellow]No mods found. Run a scan first![/yellow]")
             return
 
-        # Sort by name
-        mods.sort(key=lambda m: m['name'].lower())
-
-        # Group by subfolder
-        by_folder: dict[str, list] = {}
-        for mod in mods:
-            folder = mod.get('subfolder') or 'Root'
-            if folder not in by_folder:
-                by_folder[folder] = []
-            by_folder[folder].append(mod)
+        # Group by subfolder, then sort by name within each, in one sort
+        rows = sorted(((mod.get('subfolder') or 'Root', mod['name'].lower(), mod) for mod in mods),
+                      key=lambda row: row[:2])
 
         # Create table
         if show_details:
@@ -2077,18 +2974,17 @@ class SimsModManager:
             table.add_column("Name", style="white")
             table.add_column("Version", style="green")
 
-        for folder in sorted(by_folder.keys()):
-            for mod in by_folder[folder]:
-                icon = "[yellow]TS4[/yellow]" if mod['is_script'] else "[blue]PKG[/blue]"
-                version = mod.get('local_version', '-')
+        for folder, _, mod in rows:
+            icon = "[yellow]TS4[/yellow]" if mod['is_script'] else "[blue]PKG[/blue]"
+            version = mod.get('local_version', '-')
 
-                if show_details:
-                    size = f"{mod['size_mb']} MB"
-                    modified = mod['modified_date'][:10]
-                    source = mod.get('source_url', '-')
-                    table.add_row(icon, mod['name'], version, size, modified, source)
-                else:
-                    table.add_row(icon, folder, mod['name'], version)
+            if show_details:
+                size = f"{mod['size_mb']} MB"
+                modified = mod['modified_date'][:10]
+                source = mod.get('source_url', '-')
+                table.add_row(icon, mod['name'], version, size, modified, source)
+            else:
+                table.add_row(icon, folder, mod['name'], version)
 
         console.print()
         console.print(table)
@@ -2105,16 +3001,17 @@ class SimsModManager:
         # Find matching mods
         matches: list[tuple[str, dict]] = []
         pattern = mod_name.lower()
+        # Translated once here instead of looked up in fnmatch's cache per mod
+        wildcard_re = re.compile(fnmatch.translate(pattern)) if has_wildcard else None
 
-        for file_hash, mod in self.db.data["mods"].items():
-            mod_name_lower = mod['name'].lower()
-            if has_wildcard:
-                if fnmatch.fnmatch(mod_name_lower, pattern):
-                    matches.append((file_hash, mod))
+        for mod_name_lower, file_hash in self._mods_by_name():
+            if wildcard_re:
+                if wildcard_re.match(mod_name_lower):
+                    matches.append((file_hash, self.db.data["mods"][file_hash]))
             else:
                 # Partial match for non-wildcard searches
                 if pattern in mod_name_lower:
-                    matches.append((file_hash, mod))
+                    matches.append((file_hash, self.db.data["mods"][file_hash]))
 
         if not matches:
             console.print(f"[yellow]No mods found matching '{mod_name}'[/yellow]")
@@ -2123,6 +3020,10 @@ class SimsModManager:
         # Update all matching mods
         console.print(f"Found [cyan]{len(matches)}[/cyan] mod(s) matching '[bold]{mod_name}[/bold]':")
         for file_hash, mod in matches:
+            if mod.get('source_url') != source_url:
+                # Results from the old page don't describe the new one
+                mod['remote_info'] = None
+                mod['last_checked'] = None
             mod['source_url'] = source_url
             if creator:
                 mod['creator'] = creator
@@ -2130,9 +3031,28 @@ class SimsModManager:
                 mod['notes'] = notes
             self.db.add_mod(file_hash, mod)
             console.print(f"  [green]✓[/green] {mod['name']}")
+        self.db.flush()
     
-    def check_for_updates(self):
-        """Check all mods with source URLs for updates."""
+    def _recently_checked(self, mods_with_sources: list[tuple[str, dict]]) -> dict[str, dict]:
+        """Last results for source pages checked within UPDATE_CHECK_TTL, by URL."""
+        cutoff = datetime.now() - self.UPDATE_CHECK_TTL
+        fresh = {}
+        for _, mod in mods_with_sources:
+            if not mod.get('remote_info') or not mod.get('last_checked'):
+                continue
+            try:
+                if datetime.fromisoformat(mod['last_checked']) >= cutoff:
+                    fresh[mod['source_url']] = mod['remote_info']
+            except (TypeError, ValueError):
+                continue
+        return fresh
+
+    def check_for_updates(self, force: bool = False):
+        """Check all mods with source URLs for updates.
+
+        Pages checked in the last UPDATE_CHECK_TTL reuse their stored results
+        unless force is set.
+        """
         mods_with_sources = [
             (h, m) for h, m in self.db.data["mods"].items()
             if m.get('source_url')
@@ -2149,48 +3069,74 @@ class SimsModManager:
         up_to_date = []
         unknown_status = []
 
-        for file_hash, mod in mods_with_sources:
-            source_url = mod['source_url']
-            console.print(f"[bold]Checking:[/bold] {mod['name']}...")
-
-            update_info = self.update_checker.check_url(source_url)
-
-            if update_info:
-                mod['last_checked'] = update_info['checked_at']
-                mod['remote_info'] = update_info
-                self.db.add_mod(file_hash, mod)
-
-                local_version = mod.get('local_version')
-                remote_version = update_info.get('version')
-                comparison = UpdateChecker.compare_versions(local_version, remote_version)
-
-                # Show what we found
-                if update_info.get('title'):
-                    console.print(f"   [dim]Title:[/dim] {update_info.get('title')}")
-
-                if local_version or remote_version:
-                    local_str = local_version or 'unknown'
-                    remote_str = remote_version or 'unknown'
-                    console.print(f"   [dim]Local version:[/dim]  [yellow]{local_str}[/yellow]")
-                    console.print(f"   [dim]Remote version:[/dim] [cyan]{remote_str}[/cyan]")
-
-                    if comparison == 'update':
-                        console.print(f"   [bold red]UPDATE AVAILABLE![/bold red]")
-                        needs_update.append({
-                            'hash': file_hash,
-                            'mod': mod,
-                            'name': mod['name'],
-                            'url': source_url,
-                            'local_version': local_version,
-                            'remote_version': remote_version,
-                            'remote_info': update_info
-                        })
-                    elif comparison == 'current':
-                        console.print(f"   [green]✓ Up to date[/green]")
-                        up_to_date.append(mod['name'])
-                    elif comparison == 'newer':
-                        console.print(f"   [blue]ℹ Local version is newer than remote[/blue]")
-                        up_to_date.append(mod['name'])
+        results = {} if force else self._recently_checked(mods_with_sources)
+        if results:
+            hours = int(self.UPDATE_CHECK_TTL.total_seconds() // 3600)
+            console.print(f"[dim]Reusing results from the last {hours} hours for {len(results)} page(s) "
+                          f"(option 4b checks them again)[/dim]\n")
+
+        # Fetch the other source pages concurrently, then report mod by mod
+        stale_urls = [m['source_url'] for _, m in mods_with_sources if m['source_url'] not in results]
+        if stale_urls:
+            with console.status("[bold green]Fetching mod pages...", spinner="dots"):
+                results.update(self.update_checker.check_urls(
+                    stale_urls,
+                    previous={m['source_url']: m['remote_info'] for _, m in mods_with_sources if m.get('remote_info')},
+                ))
+
+        # Rich buffers everything printed inside "with console" and writes it once at the end,
+        # rather than once per line for every mod
+        with console:
+            for file_hash, mod in mods_with_sources:
+                source_url = mod['source_url']
+                console.print(f"[bold]Checking:[/bold] {mod['name']}...")
+
+                update_info = results.get(source_url)
+
+                if update_info:
+                    mod['last_checked'] = update_info['checked_at']
+                    mod['remote_info'] = update_info
+                    self.db.add_mod(file_hash, mod)
+
+                    local_version = mod.get('local_version')
+                    remote_version = update_info.get('version')
+                    comparison = UpdateChecker.compare_versions(local_version, remote_version)
+
+                    # Show what we found
+                    if update_info.get('title'):
+                        console.print(f"   [dim]Title:[/dim] {update_info.get('title')}")
+
+                    if local_version or remote_version:
+                        local_str = local_version or 'unknown'
+                        remote_str = remote_version or 'unknown'
+                        console.print(f"   [dim]Local version:[/dim]  [yellow]{local_str}[/yellow]")
+                        console.print(f"   [dim]Remote version:[/dim] [cyan]{remote_str}[/cyan]")
+
+                        if comparison == 'update':
+                            console.print(f"   [bold red]UPDATE AVAILABLE![/bold red]")
+                            needs_update.append({
+                                'hash': file_hash,
+                                'mod': mod,
+                                'name': mod['name'],
+                                'url': source_url,
+                                'local_version': local_version,
+                                'remote_version': remote_version,
+                                'remote_info': update_info
+                            })
+                        elif comparison == 'current':
+                            console.print(f"   [green]✓ Up to date[/green]")
+                            up_to_date.append(mod['name'])
+                        elif comparison == 'newer':
+                            console.print(f"   [blue]ℹ Local version is newer than remote[/blue]")
+                            up_to_date.append(mod['name'])
+                        else:
+                            unknown_status.append({
+                                'hash': file_hash,
+                                'mod': mod,
+                                'name': mod['name'],
+                                'url': source_url,
+                                'remote_info': update_info
+                            })
                     else:
                         unknown_status.append({
                             'hash': file_hash,
@@ -2199,31 +3145,25 @@ class SimsModManager:
                             'url': source_url,
                             'remote_info': update_info
                         })
+
+                    if update_info.get('last_updated'):
+                        console.print(f"   [dim]Last updated on site:[/dim] {update_info.get('last_updated')}")
+                    if update_info.get('download_url'):
+                        dl_url = update_info.get('download_url')
+                        console.print(f"   [dim]Download:[/dim] [cyan]{dl_url}[/cyan]")
                 else:
+                    console.print(f"   [yellow]Could not retrieve update info[/yellow]")
                     unknown_status.append({
                         'hash': file_hash,
                         'mod': mod,
                         'name': mod['name'],
                         'url': source_url,
-                        'remote_info': update_info
+                        'remote_info': None
                     })
 
-                if update_info.get('last_updated'):
-                    console.print(f"   [dim]Last updated on site:[/dim] {update_info.get('last_updated')}")
-                if update_info.get('download_url'):
-                    dl_url = update_info.get('download_url')
-                    console.print(f"   [dim]Download:[/dim] [cyan]{dl_url}[/cyan]")
-            else:
-                console.print(f"   [yellow]Could not retrieve update info[/yellow]")
-                unknown_status.append({
-                    'hash': file_hash,
-                    'mod': mod,
-                    'name': mod['name'],
-                    'url': source_url,
-                    'remote_info': None
-                })
+                console.print()  # Blank line between mods
 
-            console.print()  # Blank line between mods
+        self.db.flush()
 
         # Summary
         console.print(Panel.fit("[bold]Update Check Summary[/bold]", border_style="blue"))
@@ -2305,8 +3245,15 @@ class SimsModManager:
 
             # Check for very old mods
             old_threshold = datetime.now() - timedelta(days=180)
+            # Scans store the raw mtime, so only entries from before that need their date parsed
+            old_threshold_ns = int(old_threshold.timestamp()) * 1_000_000_000
             old_mods = []
             for mod in mods:
+                mtime_ns = mod.get('mtime_ns')
+                if mtime_ns is not None:
+                    if mtime_ns < old_threshold_ns:
+                        old_mods.append(mod)
+                    continue
                 try:
                     mod_date = datetime.fromisoformat(mod['modified_date'])
                     if mod_date < old_threshold:
@@ -2348,6 +3295,21 @@ class SimsModManager:
 
         return issues
     
+    @staticmethod
+    def _copy_backup_file(src, dst):
+        """shutil.copy2, with big reads where Python has no OS-level copy to hand off to.
+
+        Linux and macOS copy in the kernel and Windows uses CopyFile2 from Python
+        3.12; older Windows Pythons read 1 MB at a time, which is slow for large
+        .package files.
+        """
+        if sys.platform == 'win32' and sys.version_info < (3, 12):
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                shutil.copyfileobj(fsrc, fdst, SimsModManager.BACKUP_BUFFER_SIZE)
+            shutil.copystat(src, dst)
+            return dst
+        return shutil.copy2(src, dst)
+
     def backup_mods(self, backup_path: Optional[Path] = None):
         """Create a backup of all mods."""
         if backup_path is None:
@@ -2355,19 +3317,25 @@ class SimsModManager:
 
         console.print(f"[bold]Creating backup at:[/bold] {backup_path}")
         with console.status("[bold green]Copying files...", spinner="dots"):
-            shutil.copytree(self.mods_path, backup_path)
+            shutil.copytree(self.mods_path, backup_path, copy_function=self._copy_backup_file)
         console.print("[bold green]Backup complete![/bold green]")
         return backup_path
     
     def generate_report(self) -> Panel:
         """Generate a summary report of all mods."""
-        mods = list(self.db.data["mods"].values())
-
-        total_size = sum(m['size_bytes'] for m in mods)
-        script_count = sum(1 for m in mods if m['is_script'])
+        mods = self.db.data["mods"].values()
+
+        # All the totals in one pass over the mods
+        total_size = script_count = with_sources = with_versions = 0
+        for m in mods:
+            total_size += m['size_bytes']
+            if m['is_script']:
+                script_count += 1
+            if m.get('source_url'):
+                with_sources += 1
+            if m.get('local_version'):
+                with_versions += 1
         package_count = len(mods) - script_count
-        with_sources = sum(1 for m in mods if m.get('source_url'))
-        with_versions = sum(1 for m in mods if m.get('local_version'))
 
         # Create stats table
         stats_table = Table(show_header=False, box=None, padding=(0, 2))
@@ -2381,11 +3349,6 @@ class SimsModManager:
         stats_table.add_row("With Source URLs", f"{with_sources}")
         stats_table.add_row("With Versions", f"{with_versions}")
 
-        # Create the report panel
-        report_text = Text()
-        report_text.append(f"Mods Folder: ", style="bold")
-        report_text.append(f"{self.mods_path}\n\n", style="dim")
-
         return Panel(
             stats_table,
             title=f"[bold]Mod Manager Report[/bold] - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
@@ -2399,16 +3362,21 @@ class SimsModManager:
 # COMMAND LINE INTERFACE
 # ============================================================================
 
+BANNER = "[bold green]SIMS 4 MOD MANAGER[/bold green]\n[dim]Track, update, and manage your mods[/dim]"
+
+
 def show_menu() -> Table:
     """Create the main menu table."""
     table = Table(show_header=False, box=box.SIMPLE, padding=(0, 2))
     table.add_column("Key", style="bold cyan", width=4)
     table.add_column("Action", style="white")
 
-    table.add_row("1", "Scan mods folder")
+    table.add_row("1", "Scan mods folder (skips unchanged files)")
+    table.add_row("1b", "Full rescan (re-hash every file)")
     table.add_row("2", "List all mods")
     table.add_row("3", "List mods (detailed)")
     table.add_row("4", "Check for updates & install")
+    table.add_row("4b", "Check for updates (re-fetch every page)")
     table.add_row("5", "Import mod from Downloads")
     table.add_row("6", "Find potentially broken mods")
     table.add_row("7", "Add source URL to mod")
@@ -2422,11 +3390,7 @@ def show_menu() -> Table:
 
 def main():
     """Main CLI interface."""
-    console.print(Panel.fit(
-        "[bold green]SIMS 4 MOD MANAGER[/bold green]\n[dim]Track, update, and manage your mods[/dim]",
-        border_style="green",
-        padding=(1, 4)
-    ))
+    console.print(Panel.fit(BANNER, border_style="green", padding=(1, 4)))
 
     # Parse command line arguments
     global DEBUG
@@ -2437,13 +3401,10 @@ def main():
         args.remove('--debug')
         console.print("[dim][Debug mode enabled][/dim]")
 
-    # Check for updates on startup
-    updater = AutoUpdater()
-    if updater.prompt_and_update():
-        # User chose to update - exit to allow update to proceed
-        sys.exit(0)
-
-    console.print()  # Add spacing after update check
+    # --rescan ignores cached hashes/versions for the startup scan
+    rescan = '--rescan' in args
+    if rescan:
+        args.remove('--rescan')
 
     # Check for custom path argument
     mods_path = None
@@ -2452,7 +3413,14 @@ def main():
 
     manager = SimsModManager(mods_path)
 
+    # Check for updates in the background while the startup scan runs
+    # (the mod database caches the latest release)
+    updater = AutoUpdater(manager.db if manager.mods_path.exists() else None)
+    updater.start_background_check()
+
     if not manager.mods_path.exists():
+        if updater.prompt_and_update():
+            sys.exit(0)
         console.print(f"\n[bold red]Mods folder not found at:[/bold red] {manager.mods_path}")
         console.print("\nPlease either:")
         console.print("  1. Run this script with the correct path:")
@@ -2461,7 +3429,12 @@ def main():
         return
 
     # Automatically scan mods folder on startup
-    manager.scan_mods()
+    manager.scan_mods(force=rescan)
+
+    console.print()
+    if updater.prompt_and_update():
+        # User chose to update - exit to allow update to proceed
+        sys.exit(0)
 
     while True:
         console.print()
@@ -2472,6 +3445,9 @@ def main():
         if choice == '1':
             manager.scan_mods()
 
+        elif choice.lower() == '1b':
+            manager.scan_mods(force=True)
+
         elif choice == '2':
             manager.list_mods(show_details=False)
 
@@ -2481,6 +3457,9 @@ def main():
         elif choice == '4':
             manager.check_for_updates()
 
+        elif choice.lower() == '4b':
+            manager.check_for_updates(force=True)
+
         elif choice == '5':
             manager.import_downloaded_mod()
 
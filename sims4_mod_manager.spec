@@ -74,6 +74,8 @@ a = Analysis(
         'requests',
         'bs4',
         'beautifulsoup4',
+        'lxml',
+        'lxml.etree',
         'rich',
         'rich.text',
         'rich.table',
@@ -0,0 +1,151 @@
+"""Tests for sims4_mod_manager."""
+
+from datetime import datetime
+
+import pytest
+
+import sims4_mod_manager as smm
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """A manager over a Mods folder holding one package mod, already scanned."""
+    (tmp_path / "CoolMod_v1.2.package").write_bytes(b"DBPF" + b"\0" * 64)
+    manager = smm.SimsModManager(tmp_path)
+    manager.scan_mods()
+    return manager
+
+
+class FakeChecker:
+    """Stands in for UpdateChecker.check_urls, recording what was fetched."""
+
+    def __init__(self, version="1.3"):
+        self.version = version
+        self.calls = []
+
+    def __call__(self, urls, previous=None, max_workers=None):
+        self.calls.append((list(urls), dict(previous or {})))
+        return {
+            url: {
+                'url': url,
+                'version': self.version,
+                'etag': '"abc"',
+                'last_modified': 'Wed, 01 Jan 2025 00:00:00 GMT',
+                'checked_at': datetime.now().isoformat(),
+            }
+            for url in urls
+        }
+
+
+@pytest.fixture
+def fake_checker(manager, monkeypatch):
+    checker = FakeChecker()
+    monkeypatch.setattr(manager.update_checker, 'check_urls', checker)
+    monkeypatch.setattr(smm.Prompt, 'ask', staticmethod(lambda *args, **kwargs: 'skip'))
+    return checker
+
+
+def only_mod(manager) -> dict:
+    (mod,) = manager.db.data["mods"].values()
+    return mod
+
+
+def test_recent_check_survives_rescan(manager, fake_checker):
+    manager.add_mod_source('CoolMod', 'https://example.com/coolmod')
+    manager.check_for_updates()
+    manager.scan_mods()
+    manager.check_for_updates()
+
+    assert len(fake_checker.calls) == 1
+    assert only_mod(manager)['remote_info']['version'] == '1.3'
+
+
+def test_changing_source_url_drops_old_results(manager, fake_checker):
+    manager.add_mod_source('CoolMod', 'https://example.com/coolmod')
+    manager.check_for_updates()
+    manager.add_mod_source('CoolMod', 'https://example.com/coolmod-v2')
+    manager.check_for_updates()
+
+    assert [urls for urls, _ in fake_checker.calls] == [
+        ['https://example.com/coolmod'], ['https://example.com/coolmod-v2']]
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+def test_rescanned_mod_sends_conditional_request(manager, monkeypatch):
+    pytest.importorskip('bs4')
+    monkeypatch.setattr(smm.Prompt, 'ask', staticmethod(lambda *args, **kwargs: 'skip'))
+    sent_headers = []
+
+    def fetch_page(url, timeout, headers=None):
+        sent_headers.append(headers or {})
+        if headers:
+            return FakeResponse(304), ''
+        page_headers = {'ETag': '"abc"', 'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'}
+        return FakeResponse(200, page_headers), '<html><p>Version 1.3.0</p></html>'
+
+    monkeypatch.setattr(manager.update_checker, '_fetch_page', fetch_page)
+    manager.add_mod_source('CoolMod', 'https://example.com/coolmod')
+    manager.check_for_updates()
+    manager.scan_mods()
+    manager.check_for_updates(force=True)
+
+    assert sent_headers[-1] == {
+        'If-None-Match': '"abc"', 'If-Modified-Since': 'Wed, 01 Jan 2025 00:00:00 GMT'}
+    assert only_mod(manager)['remote_info']['version'] == '1.3.0'
+
+
+def test_unchanged_rescan_of_checked_mod_does_not_save(manager, fake_checker, monkeypatch):
+    manager.add_mod_source('CoolMod', 'https://example.com/coolmod')
+    manager.check_for_updates()
+    saves = []
+    monkeypatch.setattr(manager.db, 'save', lambda: saves.append(True))
+
+    manager.scan_mods()
+
+    assert saves == []
+
+
+def test_page_results_are_cached_per_page_content():
+    checker = smm.UpdateChecker()
+    pages = {'<p>a</p>': '1.0', '<p>b</p>': '2.0'}
+    calls = []
+
+    def find(markup):
+        calls.append(markup)
+        return pages[markup]
+
+    assert checker._cached_page_result('version', '<p>a</p>', find) == '1.0'
+    assert checker._cached_page_result('version', '<p>b</p>', find) == '2.0'
+    assert checker._cached_page_result('version', '<p>a</p>', find) == '1.0'
+    assert calls == ['<p>a</p>', '<p>b</p>']
+
+
+VERSION_PAGES = [
+    '<html><body>Version 3.4.5<div><p>Latest version: 1.2.0</p></div></body></html>',
+    '<html><body><svg><text>v9.9.9</text></svg><noscript>Version 2.0.1</noscript>'
+    '<section id="changelog"><h2>Changelog</h2><p>1.4.2 - fixes</p></section></body></html>',
+    '<html><head><meta name="version" content="5.1"></head><body>2025.9.1<p>2025.7.0</p></body></html>',
+    '<html><body>Release 7.7.7<span class="mod-version">v58</span>trailing 8.8.8</body></html>',
+]
+
+
+@pytest.mark.parametrize('markup', VERSION_PAGES)
+def test_find_version_same_with_and_without_lxml(markup, monkeypatch):
+    pytest.importorskip('bs4')
+    pytest.importorskip('lxml')
+    checker = smm.UpdateChecker()
+    tags = checker.GENERIC_PAGE_TAGS
+    tree = smm.make_tree(markup, tags)
+    monkeypatch.setattr(smm, 'HTML_PARSER', 'html.parser')
+    soup = smm.make_soup(markup, tags)
+
+    assert checker._find_version(tree) == checker._find_version(soup)